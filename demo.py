@@ -4,20 +4,110 @@ Demo script to showcase all utility functions
 """
 
 import sys
-import os
-
-# Add parent directory to path so demo can be run without package installation
-# This is intentional for demo/example scripts
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# demo.py lives at the repository root, so running it already puts both
+# ``utils`` and ``examples`` on sys.path
+from examples._common import PrintBuffer, print_header, use_block_buffered_stdout
 from utils.commands import get_common_commands, get_system_info
 
 
-def print_header(title):
-    """Print a formatted header"""
-    print("\n" + "=" * 70)
-    print(f" {title}")
-    print("=" * 70 + "\n")
+_UTILITIES = {
+    "📄 PDF Utilities": [
+        "Download PDF from URL",
+        "Merge multiple PDFs",
+        "Split PDF into pages",
+        "Convert PDF to images"
+    ],
+    "🖼️ Image Utilities": [
+        "Resize images",
+        "Convert image formats",
+        "Update image resolution",
+        "Compress images",
+        "Create thumbnails"
+    ],
+    "📁 File Utilities": [
+        "Copy files",
+        "Move files",
+        "Delete files",
+        "Compress folders",
+        "Extract archives",
+        "Get file sizes"
+    ],
+    "💻 Command Utilities": [
+        "List common commands",
+        "Execute shell commands",
+        "Get system information",
+        "Print commands by category"
+    ],
+    "📝 Text Utilities": [
+        "Count words and characters",
+        "Case conversion (snake, camel, kebab)",
+        "Extract emails and URLs",
+        "Truncate text",
+        "Remove HTML tags"
+    ],
+    "🌐 Network Utilities": [
+        "Check internet connection",
+        "Get IP address",
+        "Validate and parse URLs",
+        "Build URLs with parameters",
+        "Check port availability"
+    ],
+    "💾 Data Utilities": [
+        "Read/write JSON",
+        "Read/write CSV",
+        "Convert JSON ↔ CSV",
+        "Flatten dictionaries",
+        "Merge and filter dictionaries"
+    ],
+    "🕐 DateTime Utilities": [
+        "Get current date/time",
+        "Parse and format dates",
+        "Add/subtract days",
+        "Calculate age",
+        "Check if weekend",
+        "Human-readable time ago"
+    ]
+}
+
+_UNDERSCORE_TO_SPACE = str.maketrans('_', ' ')
+
+# Labels for the keys get_system_info() always returns
+_INFO_LABELS = {
+    key: key.translate(_UNDERSCORE_TO_SPACE).title()
+    for key in ('system', 'release', 'version', 'machine', 'processor',
+                'python_version', 'hostname', 'distribution')
+}
+
+# The remaining sections are static, so they are formatted once at import
+_UTILITIES_BLOCK = "".join(
+    category + "\n" + "".join(f"  ✓ {feature}\n" for feature in features) + "\n"
+    for category, features in _UTILITIES.items()
+)
+
+_QUICKSTART = "\n".join([
+    "Install dependencies:",
+    "  $ pip install -r requirements.txt\n",
+    "Run examples:",
+    "  $ python examples/pdf_examples.py",
+    "  $ python examples/image_examples.py",
+    "  $ python examples/file_examples.py",
+    "  $ python examples/command_examples.py\n",
+    "Import and use:",
+    "  from utils.pdf import download_pdf",
+    "  from utils.image import resize_image",
+    "  from utils.file import compress_folder",
+    "  from utils.commands import get_system_info\n",
+]) + "\n"
+
+_DOCUMENTATION = "\n".join([
+    "For detailed documentation and usage examples, see:",
+    "  → README.md",
+    "  → examples/ directory",
+    "  → Individual utility files in utils/\n",
+]) + "\n"
+
+_FOOTER = "=" * 70 + "\n  Happy coding! ⭐\n" + "=" * 70 + "\n\n"
 
 
 def main():
@@ -28,111 +118,36 @@ def main():
     # System Information
     print_header("📊 System Information")
     info = get_system_info()
-    for key, value in info.items():
-        print(f"  {key.replace('_', ' ').title()}: {value}")
+    sys.stdout.write("".join(
+        f"  {_INFO_LABELS.get(key) or key.translate(_UNDERSCORE_TO_SPACE).title()}: {value}\n"
+        for key, value in info.items()
+    ))
     
     # Available Utilities
     print_header("🔧 Available Utility Categories")
-    
-    utilities = {
-        "📄 PDF Utilities": [
-            "Download PDF from URL",
-            "Merge multiple PDFs",
-            "Split PDF into pages",
-            "Convert PDF to images"
-        ],
-        "🖼️ Image Utilities": [
-            "Resize images",
-            "Convert image formats",
-            "Update image resolution",
-            "Compress images",
-            "Create thumbnails"
-        ],
-        "📁 File Utilities": [
-            "Copy files",
-            "Move files",
-            "Delete files",
-            "Compress folders",
-            "Extract archives",
-            "Get file sizes"
-        ],
-        "💻 Command Utilities": [
-            "List common commands",
-            "Execute shell commands",
-            "Get system information",
-            "Print commands by category"
-        ],
-        "📝 Text Utilities": [
-            "Count words and characters",
-            "Case conversion (snake, camel, kebab)",
-            "Extract emails and URLs",
-            "Truncate text",
-            "Remove HTML tags"
-        ],
-        "🌐 Network Utilities": [
-            "Check internet connection",
-            "Get IP address",
-            "Validate and parse URLs",
-            "Build URLs with parameters",
-            "Check port availability"
-        ],
-        "💾 Data Utilities": [
-            "Read/write JSON",
-            "Read/write CSV",
-            "Convert JSON ↔ CSV",
-            "Flatten dictionaries",
-            "Merge and filter dictionaries"
-        ],
-        "🕐 DateTime Utilities": [
-            "Get current date/time",
-            "Parse and format dates",
-            "Add/subtract days",
-            "Calculate age",
-            "Check if weekend",
-            "Human-readable time ago"
-        ]
-    }
-    
-    for category, features in utilities.items():
-        print(f"{category}")
-        for feature in features:
-            print(f"  ✓ {feature}")
-        print()
+    sys.stdout.write(_UTILITIES_BLOCK)
     
     # Command Categories
     print_header("📋 Available Command Categories")
     commands = get_common_commands()
-    categories = list(commands.keys())
-    for i, category in enumerate(categories, 1):
-        cmd_count = len(commands[category])
-        print(f"  {i}. {category.replace('_', ' ').title()} ({cmd_count} commands)")
+    lines = [
+        f"  {i}. {category.translate(_UNDERSCORE_TO_SPACE).title()} ({len(cmds)} commands)"
+        for i, (category, cmds) in enumerate(commands.items(), 1)
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Quick Start
     print_header("🚀 Quick Start")
-    print("Install dependencies:")
-    print("  $ pip install -r requirements.txt\n")
-    print("Run examples:")
-    print("  $ python examples/pdf_examples.py")
-    print("  $ python examples/image_examples.py")
-    print("  $ python examples/file_examples.py")
-    print("  $ python examples/command_examples.py\n")
-    print("Import and use:")
-    print("  from utils.pdf import download_pdf")
-    print("  from utils.image import resize_image")
-    print("  from utils.file import compress_folder")
-    print("  from utils.commands import get_system_info\n")
+    sys.stdout.write(_QUICKSTART)
     
     # Documentation
     print_header("📚 Documentation")
-    print("For detailed documentation and usage examples, see:")
-    print("  → README.md")
-    print("  → examples/ directory")
-    print("  → Individual utility files in utils/\n")
+    sys.stdout.write(_DOCUMENTATION)
     
-    print("=" * 70)
-    print("  Happy coding! ⭐")
-    print("=" * 70 + "\n")
+    sys.stdout.write(_FOOTER)
 
 
 if __name__ == "__main__":
-    main()
+    use_block_buffered_stdout()
+    with PrintBuffer():
+        main()
@@ -0,0 +1,15 @@
+"""
+Make the ``utils`` package importable from the example scripts
+
+Importing this module adds the repository root to sys.path. Python caches
+modules in sys.modules, so the path is resolved only once per process no
+matter how many example scripts import it.
+"""
+
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
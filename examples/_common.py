@@ -0,0 +1,95 @@
+"""
+Shared helpers for the example and demo scripts
+"""
+
+import atexit
+import io
+import sys
+from contextlib import redirect_stdout
+
+
+def print_header(title: str, width: int = 70) -> None:
+    """
+    Print a section header framed by horizontal rules
+
+    Args:
+        title: Header text
+        width: Width of the rules in characters (default: 70)
+    """
+    print("\n" + "=" * width)
+    print(f" {title}")
+    print("=" * width + "\n")
+
+
+def banner(title: str, width: int = 60) -> None:
+    """
+    Print the opening banner of an example script
+
+    Args:
+        title: Banner text
+        width: Width of the rules in characters (default: 60)
+    """
+    print("=" * width)
+    print(title)
+    print("=" * width)
+
+
+def use_block_buffered_stdout(buffer_size: int = 1 << 16) -> None:
+    """
+    Switch sys.stdout from line buffering to a large block buffer
+
+    When attached to a TTY Python flushes stdout on every newline. The demo
+    scripts don't need interactive progress, so buffer output in blocks of
+    ``buffer_size`` bytes and drain whatever is left on interpreter exit.
+
+    Args:
+        buffer_size: Size of the output buffer in bytes (default: 64 KiB)
+
+    Example:
+        >>> use_block_buffered_stdout()
+    """
+    try:
+        fileno = sys.stdout.fileno()
+    except (AttributeError, io.UnsupportedOperation, ValueError):
+        # stdout is not backed by a real file (e.g. captured by a test runner)
+        return
+
+    sys.stdout.flush()
+    raw = open(fileno, 'wb', buffering=buffer_size, closefd=False)
+    sys.stdout = io.TextIOWrapper(
+        raw,
+        encoding=sys.stdout.encoding,
+        errors=sys.stdout.errors,
+        line_buffering=False
+    )
+    atexit.register(sys.stdout.flush)
+
+
+class PrintBuffer:
+    """
+    Collect everything printed inside the block and write it out in one go
+
+    Example scripts issue dozens of small print() calls; on a TTY each of
+    them becomes its own write() syscall. Inside this context manager stdout
+    is redirected to an in-memory buffer that is written and flushed once
+    on exit.
+
+    Example:
+        >>> with PrintBuffer():
+        ...     print("Hello")
+        ...     print("World")
+    """
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._redirect = redirect_stdout(self._buffer)
+
+    def __enter__(self):
+        self._redirect.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._redirect.__exit__(exc_type, exc_value, traceback)
+        sys.stdout.write(self._buffer.getvalue())
+        sys.stdout.flush()
+        return False
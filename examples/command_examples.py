@@ -2,16 +2,13 @@
 Example usage of Command utility functions
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401
+from _common import PrintBuffer, banner, use_block_buffered_stdout
 
 from utils.commands import get_common_commands, execute_command, get_system_info, print_commands_by_category
 
 def main():
-    print("=" * 60)
-    print("Command Utilities Examples")
-    print("=" * 60)
+    banner("Command Utilities Examples")
     
     # Example 1: Get common commands
     print("\n1. Get common commands by category:")
@@ -44,4 +41,6 @@ def main():
     print("=" * 60)
 
 if __name__ == "__main__":
-    main()
+    use_block_buffered_stdout()
+    with PrintBuffer():
+        main()
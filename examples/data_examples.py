@@ -2,9 +2,8 @@
 Example usage of Data utility functions
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401
+from _common import PrintBuffer, banner, use_block_buffered_stdout
 
 from utils.data import (
     read_json, write_json, pretty_print_json, read_csv, write_csv,
@@ -12,9 +11,7 @@ from utils.data import (
 )
 
 def main():
-    print("=" * 60)
-    print("Data Utilities Examples")
-    print("=" * 60)
+    banner("Data Utilities Examples")
     
     # Example 1: JSON operations
     print("\n1. JSON operations:")
@@ -71,4 +68,6 @@ def main():
     print("=" * 60)
 
 if __name__ == "__main__":
-    main()
+    use_block_buffered_stdout()
+    with PrintBuffer():
+        main()
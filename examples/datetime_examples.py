@@ -2,9 +2,8 @@
 Example usage of DateTime utility functions
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401
+from _common import PrintBuffer, banner, use_block_buffered_stdout
 
 from utils.datetime import (
     get_current_timestamp, get_current_date, get_current_time,
@@ -13,9 +12,7 @@ from utils.datetime import (
 )
 
 def main():
-    print("=" * 60)
-    print("DateTime Utilities Examples")
-    print("=" * 60)
+    banner("DateTime Utilities Examples")
     
     # Example 1: Get current date and time
     print("\n1. Get current date and time:")
@@ -69,4 +66,6 @@ def main():
     print("=" * 60)
 
 if __name__ == "__main__":
-    main()
+    use_block_buffered_stdout()
+    with PrintBuffer():
+        main()
@@ -2,16 +2,13 @@
 Example usage of File utility functions
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401
+from _common import PrintBuffer, banner, use_block_buffered_stdout
 
 from utils.file import copy_files, move_files, delete_files, compress_folder, extract_archive, get_file_size
 
 def main():
-    print("=" * 60)
-    print("File Utilities Examples")
-    print("=" * 60)
+    banner("File Utilities Examples")
     
     # Example 1: Copy files
     print("\n1. Copy multiple files to a directory:")
@@ -44,4 +41,6 @@ def main():
     print("=" * 60)
 
 if __name__ == "__main__":
-    main()
+    use_block_buffered_stdout()
+    with PrintBuffer():
+        main()
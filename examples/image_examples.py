@@ -2,16 +2,13 @@
 Example usage of Image utility functions
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401
+from _common import PrintBuffer, banner, use_block_buffered_stdout
 
 from utils.image import resize_image, convert_image, update_resolution, compress_image, create_thumbnail
 
 def main():
-    print("=" * 60)
-    print("Image Utilities Examples")
-    print("=" * 60)
+    banner("Image Utilities Examples")
     
     # Example 1: Resize image
     print("\n1. Resize an image (maintaining aspect ratio):")
@@ -39,4 +36,6 @@ def main():
     print("=" * 60)
 
 if __name__ == "__main__":
-    main()
+    use_block_buffered_stdout()
+    with PrintBuffer():
+        main()
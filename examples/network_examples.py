@@ -2,9 +2,8 @@
 Example usage of Network utility functions
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401
+from _common import PrintBuffer, banner, use_block_buffered_stdout
 
 from utils.network import (
     check_internet_connection, get_ip_address, is_valid_url,
@@ -12,9 +11,7 @@ from utils.network import (
 )
 
 def main():
-    print("=" * 60)
-    print("Network Utilities Examples")
-    print("=" * 60)
+    banner("Network Utilities Examples")
     
     # Example 1: Check internet connection
     print("\n1. Check internet connection:")
@@ -66,4 +63,6 @@ def main():
     print("=" * 60)
 
 if __name__ == "__main__":
-    main()
+    use_block_buffered_stdout()
+    with PrintBuffer():
+        main()
@@ -2,16 +2,13 @@
 Example usage of PDF utility functions
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401
+from _common import PrintBuffer, banner, use_block_buffered_stdout
 
 from utils.pdf import download_pdf, merge_pdfs, split_pdf, pdf_to_images
 
 def main():
-    print("=" * 60)
-    print("PDF Utilities Examples")
-    print("=" * 60)
+    banner("PDF Utilities Examples")
     
     # Example 1: Download a PDF
     print("\n1. Download PDF from URL:")
@@ -35,4 +32,6 @@ def main():
     print("=" * 60)
 
 if __name__ == "__main__":
-    main()
+    use_block_buffered_stdout()
+    with PrintBuffer():
+        main()
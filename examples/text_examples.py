@@ -2,9 +2,8 @@
 Example usage of Text utility functions
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401
+from _common import PrintBuffer, banner, use_block_buffered_stdout
 
 from utils.text import (
     count_words, count_characters, reverse_text, to_snake_case,
@@ -13,9 +12,7 @@ from utils.text import (
 )
 
 def main():
-    print("=" * 60)
-    print("Text Utilities Examples")
-    print("=" * 60)
+    banner("Text Utilities Examples")
     
     # Example 1: Count words and characters
     print("\n1. Count words and characters:")
@@ -57,4 +54,6 @@ def main():
     print("=" * 60)
 
 if __name__ == "__main__":
-    main()
+    use_block_buffered_stdout()
+    with PrintBuffer():
+        main()
@@ -0,0 +1,136 @@
+"""Tests for utils.commands"""
+
+import json
+import os
+import unittest
+
+from utils.commands import (
+    ShellSession, execute_command, execute_commands, get_commands_for_category,
+    get_common_commands, get_system_info
+)
+
+
+@unittest.skipUnless(os.name == 'posix', "ShellSession is POSIX only")
+class TestShellSession(unittest.TestCase):
+    
+    def setUp(self):
+        self.session = ShellSession(timeout=10)
+        self.addCleanup(self.session.close)
+    
+    def test_state_persists_between_commands(self):
+        self.session.run('cd / && greeting=hello')
+        result = self.session.run('pwd; echo "$greeting"')
+        self.assertTrue(result['success'])
+        self.assertEqual(result['stdout'], '/\nhello\n')
+    
+    def test_incomplete_commands_fail_without_hanging(self):
+        for command in ("echo 'unterminated", "if true; then", "echo (", "case x in"):
+            with self.subTest(command=command):
+                result = self.session.run(command)
+                self.assertFalse(result['success'])
+                self.assertNotEqual(result['returncode'], 0)
+        self.assertEqual(self.session.run('echo still alive')['stdout'], 'still alive\n')
+    
+    def test_quotes_and_newlines_are_passed_through(self):
+        result = self.session.run("printf '%s\\n' \"it's\" 'a b'\necho done")
+        self.assertEqual(result['stdout'], "it's\na b\ndone\n")
+    
+    def test_large_output(self):
+        # Spans many reads, so the end marker can arrive split across two of them
+        result = self.session.run("head -c 3000000 /dev/zero | tr '\\0' a; (exit 3)")
+        self.assertEqual(result['returncode'], 3)
+        self.assertEqual(result['stdout'], 'a' * 3000000)
+    
+    def test_exit_status(self):
+        result = self.session.run('false')
+        self.assertEqual(result['returncode'], 1)
+        self.assertFalse(result['success'])
+    
+    def test_timeout_restarts_the_shell(self):
+        self.session.run('cd /')
+        result = self.session.run('echo started; sleep 30', timeout=0.5)
+        self.assertFalse(result['success'])
+        self.assertEqual(result['stdout'], 'started\n')
+        self.assertIn('timed out', result['stderr'])
+        
+        result = self.session.run('echo fresh')
+        self.assertTrue(result['success'])
+        self.assertEqual(result['stdout'], 'fresh\n')
+
+
+
+@unittest.skipUnless(os.name == 'posix', "compares against /bin/sh")
+class TestExecuteCommand(unittest.TestCase):
+    
+    def test_builtins_match_the_shell(self):
+        # /usr/bin/echo takes -e as an option where sh's echo builtin may not
+        for command in ('echo -e hi', 'pwd', 'true', 'false'):
+            with self.subTest(command=command):
+                direct = execute_command(command)
+                via_shell = execute_command(command + ' ;')
+                self.assertEqual(direct['stdout'], via_shell['stdout'])
+                self.assertEqual(direct['returncode'], via_shell['returncode'])
+    
+    def test_plain_program(self):
+        result = execute_command('ls -d /')
+        self.assertTrue(result['success'])
+        self.assertEqual(result['stdout'], '/\n')
+
+
+
+@unittest.skipUnless(os.name == 'posix', "runs the batch through /bin/sh")
+class TestExecuteCommands(unittest.TestCase):
+    
+    def test_one_result_per_command(self):
+        results = execute_commands(['cd /', 'pwd', 'echo err >&2; false'], stop_on_error=False)
+        self.assertEqual([r['returncode'] for r in results], [0, 0, 1])
+        self.assertEqual(results[1]['stdout'], '/\n')
+        self.assertEqual(results[2]['stderr'], 'err\n')
+    
+    def test_unparsable_command_does_not_swallow_the_rest(self):
+        results = execute_commands(["echo 'unterminated", 'if true; then', 'echo after'],
+                                   stop_on_error=False)
+        self.assertEqual(len(results), 3)
+        self.assertFalse(results[0]['success'])
+        self.assertFalse(results[1]['success'])
+        self.assertEqual(results[2]['stdout'], 'after\n')
+    
+    def test_stop_on_error(self):
+        results = execute_commands(['true', 'false', 'echo skipped'])
+        self.assertEqual([r['success'] for r in results], [True, False])
+
+
+class TestGetCommonCommands(unittest.TestCase):
+    
+    def test_changes_do_not_leak_into_later_calls(self):
+        commands = get_common_commands()
+        original = commands['git'][0]['command']
+        commands['git'][0]['command'] = 'changed'
+        commands['git'].clear()
+        del commands['network']
+        
+        fresh = get_common_commands()
+        self.assertEqual(fresh['git'][0]['command'], original)
+        self.assertIn('network', fresh)
+        self.assertEqual(json.loads(json.dumps(fresh)), fresh)
+    
+    def test_category_lookup_returns_copies(self):
+        self.assertIsNone(get_commands_for_category('missing'))
+        get_commands_for_category('git')[0]['command'] = 'changed'
+        self.assertEqual(get_commands_for_category('git'), get_common_commands()['git'])
+        self.assertNotEqual(get_commands_for_category('git')[0]['command'], 'changed')
+
+
+class TestGetSystemInfo(unittest.TestCase):
+    
+    def test_returns_a_json_serializable_copy(self):
+        info = get_system_info()
+        self.assertIsInstance(info, dict)
+        self.assertEqual(json.loads(json.dumps(info)), info)
+        
+        info['extra'] = 'added'
+        self.assertNotIn('extra', get_system_info())
+
+
+if __name__ == '__main__':
+    unittest.main()
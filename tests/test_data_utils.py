@@ -0,0 +1,32 @@
+"""Tests for utils.data"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from utils.data import read_json
+
+
+class TestReadJson(unittest.TestCase):
+    
+    def _read(self, text):
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            f.write(text)
+        self.addCleanup(os.remove, f.name)
+        return read_json(f.name)
+    
+    def test_matches_json(self):
+        text = '{"a": [1, 2.5, null, true], "b": "\\u00e9", "c": {"d": -3}}'
+        self.assertEqual(self._read(text), json.loads(text))
+    
+    def test_big_integers_stay_exact(self):
+        for value in (123456789012345678901234567890, -9223372036854775809, 18446744073709551616):
+            with self.subTest(value=value):
+                data = self._read(f'{{"id": {value}}}')
+                self.assertEqual(data['id'], value)
+                self.assertIsInstance(data['id'], int)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""Tests for utils.file"""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from utils.file import compress_folder, copy_files
+
+
+class TestCopyFiles(unittest.TestCase):
+    
+    def setUp(self):
+        scratch = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch.cleanup)
+        self.root = scratch.name
+    
+    def _copy(self, *args, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return copy_files(*args, **kwargs)
+    
+    def test_copies_contents(self):
+        source = os.path.join(self.root, 'a.txt')
+        with open(source, 'w') as f:
+            f.write('hello')
+        destination = os.path.join(self.root, 'out')
+        os.mkdir(destination)
+        
+        self.assertTrue(self._copy([source], destination))
+        with open(os.path.join(destination, 'a.txt')) as f:
+            self.assertEqual(f.read(), 'hello')
+    
+    def test_directory_source_leaves_nothing_behind(self):
+        source = os.path.join(self.root, 'folder')
+        os.mkdir(source)
+        destination = os.path.join(self.root, 'out')
+        os.mkdir(destination)
+        
+        self.assertFalse(self._copy([source], destination))
+        self.assertEqual(os.listdir(destination), [])
+
+
+
+class TestCompressFolder(unittest.TestCase):
+    
+    def _compress_output(self, missing):
+        error = ImportError(f"No module named {missing!r}", name=missing)
+        out = io.StringIO()
+        with tempfile.TemporaryDirectory() as folder, contextlib.redirect_stdout(out), \
+                mock.patch('utils.file.file_utils._write_tar_gz', side_effect=error):
+            self.assertFalse(compress_folder(folder, folder + '.tar.gz', format='tar.gz'))
+        return out.getvalue()
+    
+    def test_missing_zstandard_gets_the_install_hint(self):
+        self.assertIn('pip install zstandard', self._compress_output('zstandard'))
+    
+    def test_other_import_errors_name_the_module(self):
+        output = self._compress_output('isal._isal')
+        self.assertNotIn('zstandard', output)
+        self.assertIn('isal._isal', output)
+
+
+if __name__ == '__main__':
+    unittest.main()
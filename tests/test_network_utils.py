@@ -0,0 +1,48 @@
+"""Tests for utils.network"""
+
+import socket
+import unittest
+
+from utils.network import get_domain_from_url, is_port_open_many, is_valid_url
+from utils.network.network_utils import _quote_plus_cached
+
+
+class TestUrlCaches(unittest.TestCase):
+    
+    def test_get_domain_from_url_is_cached(self):
+        get_domain_from_url.cache_clear()
+        self.assertEqual(get_domain_from_url("https://www.example.com/path"), 'www.example.com')
+        self.assertEqual(get_domain_from_url("https://www.example.com/path"), 'www.example.com')
+        info = get_domain_from_url.cache_info()
+        self.assertEqual(info.maxsize, 4096)
+        self.assertEqual((info.hits, info.misses), (1, 1))
+    
+    def test_is_valid_url_is_cached(self):
+        self.assertEqual(is_valid_url.cache_info().maxsize, 4096)
+    
+    def test_quote_plus_cache_is_not_stacked(self):
+        # A second lru_cache stacked on top would hide the 8192-entry one
+        self.assertEqual(_quote_plus_cached.cache_info().maxsize, 8192)
+        self.assertFalse(hasattr(_quote_plus_cached.__wrapped__, 'cache_info'))
+        self.assertEqual(_quote_plus_cached('a b&c'), 'a+b%26c')
+
+
+
+class TestIsPortOpenMany(unittest.TestCase):
+    
+    def test_bad_targets_do_not_abort_the_batch(self):
+        with socket.socket() as server:
+            server.bind(('127.0.0.1', 0))
+            server.listen()
+            port = server.getsockname()[1]
+            targets = [
+                ('127.0.0.1', port),
+                ('127.0.0.1', 70000),
+                ('127.0.0.1', 'http'),
+                ('bad\x00host', 80),
+            ]
+            self.assertEqual(is_port_open_many(targets, timeout=1), [True, False, False, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""Tests for utils.text"""
+
+import unittest
+
+from utils.text import extract_urls, to_title_case
+
+
+class TestToTitleCase(unittest.TestCase):
+    
+    def setUp(self):
+        to_title_case.cache_clear()
+    
+    def test_words_are_capitalized(self):
+        self.assertEqual(to_title_case("hello world"), 'Hello World')
+        self.assertEqual(to_title_case("HELLO wORLD"), 'Hello World')
+    
+    def test_apostrophes_do_not_start_words(self):
+        self.assertEqual(to_title_case("don't stop"), "Don't Stop")
+        # U+02BC MODIFIER LETTER APOSTROPHE counts as a letter but has no case
+        self.assertEqual(to_title_case("donʼt stop"), "Donʼt Stop")
+    
+    def test_caseless_letters_do_not_start_words(self):
+        self.assertEqual(to_title_case('中a b'), '中a B')
+    
+    def test_spacing_is_kept(self):
+        self.assertEqual(to_title_case("  a  b "), '  A  B ')
+        self.assertEqual(to_title_case("hello\tworld"), 'Hello\tWorld')
+        self.assertEqual(to_title_case("line one\nline two"), 'Line One\nLine Two')
+        self.assertEqual(to_title_case("it's\r\n\tok"), "It's\r\n\tOk")
+        self.assertEqual(to_title_case(""), '')
+
+
+
+class TestExtractUrls(unittest.TestCase):
+    
+    def test_plain_text(self):
+        self.assertEqual(
+            extract_urls("Visit https://example.com or http://test.org/~me#top"),
+            ['https://example.com', 'http://test.org/~me#top']
+        )
+    
+    def test_markup_ends_a_url(self):
+        for html in ("<a href='http://x.com/a'>", '<a href="http://x.com/a">', '<http://x.com/a>'):
+            with self.subTest(html=html):
+                self.assertEqual(extract_urls(html), ['http://x.com/a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,11 @@
 """Command list and helper utilities"""
 
-from .command_utils import get_common_commands, execute_command, get_system_info, print_commands_by_category
+from .command_utils import (
+    get_common_commands, get_commands_for_category, execute_command,
+    execute_commands, ShellSession, get_system_info, print_commands_by_category
+)
 
-__all__ = ['get_common_commands', 'execute_command', 'get_system_info', 'print_commands_by_category']
+__all__ = [
+    'get_common_commands', 'get_commands_for_category', 'execute_command',
+    'execute_commands', 'ShellSession', 'get_system_info', 'print_commands_by_category'
+]
@@ -3,15 +3,241 @@ Command list and helper utilities
 """
 
 import os
-import platform
-import subprocess
-from typing import Dict, List, Optional
+import re
+import shlex
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+
+# Static command catalog, one read-only tuple per category, built once at import
+_FILE_OPERATIONS_COMMANDS = (
+    {
+        "command": "ls -lah",
+        "description": "List all files with details and hidden files",
+        "platform": "Linux/Mac"
+    },
+    {
+        "command": "dir",
+        "description": "List files in directory",
+        "platform": "Windows"
+    },
+    {
+        "command": "cp -r source dest",
+        "description": "Copy directory recursively",
+        "platform": "Linux/Mac"
+    },
+    {
+        "command": "mv source dest",
+        "description": "Move or rename files",
+        "platform": "Linux/Mac"
+    },
+    {
+        "command": "rm -rf directory",
+        "description": "Remove directory and contents",
+        "platform": "Linux/Mac"
+    },
+    {
+        "command": "find . -name '*.txt'",
+        "description": "Find all .txt files in current directory",
+        "platform": "Linux/Mac"
+    }
+)
+
+_SYSTEM_INFO_COMMANDS = (
+    {
+        "command": "uname -a",
+        "description": "Display system information",
+        "platform": "Linux/Mac"
+    },
+    {
+        "command": "systeminfo",
+        "description": "Display detailed system information",
+        "platform": "Windows"
+    },
+    {
+        "command": "df -h",
+        "description": "Display disk usage in human-readable format",
+        "platform": "Linux/Mac"
+    },
+    {
+        "command": "free -h",
+        "description": "Display memory usage",
+        "platform": "Linux"
+    },
+    {
+        "command": "top",
+        "description": "Display running processes",
+        "platform": "Linux/Mac"
+    }
+)
+
+_NETWORK_COMMANDS = (
+    {
+        "command": "ping google.com",
+        "description": "Test network connectivity",
+        "platform": "All"
+    },
+    {
+        "command": "curl -I https://example.com",
+        "description": "Get HTTP headers from URL",
+        "platform": "Linux/Mac"
+    },
+    {
+        "command": "wget https://example.com/file",
+        "description": "Download file from URL",
+        "platform": "Linux/Mac"
+    },
+    {
+        "command": "ifconfig",
+        "description": "Display network interface configuration",
+        "platform": "Linux/Mac"
+    },
+    {
+        "command": "ipconfig",
+        "description": "Display network configuration",
+        "platform": "Windows"
+    }
+)
+
+_GIT_COMMANDS = (
+    {
+        "command": "git status",
+        "description": "Check repository status",
+        "platform": "All"
+    },
+    {
+        "command": "git add .",
+        "description": "Stage all changes",
+        "platform": "All"
+    },
+    {
+        "command": "git commit -m 'message'",
+        "description": "Commit staged changes",
+        "platform": "All"
+    },
+    {
+        "command": "git push",
+        "description": "Push commits to remote",
+        "platform": "All"
+    },
+    {
+        "command": "git pull",
+        "description": "Pull changes from remote",
+        "platform": "All"
+    },
+    {
+        "command": "git log --oneline",
+        "description": "View commit history (compact)",
+        "platform": "All"
+    }
+)
+
+_PACKAGE_MANAGEMENT_COMMANDS = (
+    {
+        "command": "pip install package_name",
+        "description": "Install Python package",
+        "platform": "All"
+    },
+    {
+        "command": "npm install package_name",
+        "description": "Install Node.js package",
+        "platform": "All"
+    },
+    {
+        "command": "apt-get update && apt-get install package",
+        "description": "Update and install package (Debian/Ubuntu)",
+        "platform": "Linux"
+    },
+    {
+        "command": "brew install package",
+        "description": "Install package using Homebrew",
+        "platform": "Mac"
+    }
+)
+
+_COMPRESSION_COMMANDS = (
+    {
+        "command": "tar -czf archive.tar.gz folder/",
+        "description": "Create compressed tar.gz archive",
+        "platform": "Linux/Mac"
+    },
+    {
+        "command": "tar -xzf archive.tar.gz",
+        "description": "Extract tar.gz archive",
+        "platform": "Linux/Mac"
+    },
+    {
+        "command": "zip -r archive.zip folder/",
+        "description": "Create zip archive",
+        "platform": "All"
+    },
+    {
+        "command": "unzip archive.zip",
+        "description": "Extract zip archive",
+        "platform": "All"
+    }
+)
+
+_TEXT_PROCESSING_COMMANDS = (
+    {
+        "command": "grep 'pattern' file.txt",
+        "description": "Search for pattern in file",
+        "platform": "Linux/Mac"
+    },
+    {
+        "command": "sed 's/old/new/g' file.txt",
+        "description": "Replace text in file",
+        "platform": "Linux/Mac"
+    },
+    {
+        "command": "awk '{print $1}' file.txt",
+        "description": "Print first column of file",
+        "platform": "Linux/Mac"
+    },
+    {
+        "command": "cat file1.txt file2.txt > combined.txt",
+        "description": "Concatenate files",
+        "platform": "Linux/Mac"
+    }
+)
+
+_COMMON_COMMANDS = MappingProxyType({
+    "file_operations": _FILE_OPERATIONS_COMMANDS,
+    "system_info": _SYSTEM_INFO_COMMANDS,
+    "network": _NETWORK_COMMANDS,
+    "git": _GIT_COMMANDS,
+    "package_management": _PACKAGE_MANAGEMENT_COMMANDS,
+    "compression": _COMPRESSION_COMMANDS,
+    "text_processing": _TEXT_PROCESSING_COMMANDS
+})
+
+
+# Characters that only a shell can interpret; commands without any of them
+# are plain argv lists and can be executed directly
+_NEEDS_SHELL = re.compile(r'[|&;<>()$`\\"\'*?~\[\]{}#!\n]')
+
+# Builtins and keywords of sh/bash; a program of the same name on PATH (e.g.
+# /usr/bin/echo) can behave differently, so these always go through the shell
+_SHELL_BUILTINS = frozenset((
+    '.', ':', 'alias', 'bg', 'break', 'builtin', 'case', 'cd', 'command',
+    'continue', 'declare', 'do', 'done', 'echo', 'elif', 'else', 'esac', 'eval',
+    'exec', 'exit', 'export', 'false', 'fc', 'fg', 'fi', 'for', 'function',
+    'getopts', 'hash', 'if', 'in', 'jobs', 'kill', 'let', 'local', 'printf',
+    'pwd', 'read', 'readonly', 'return', 'select', 'set', 'shift', 'source',
+    'test', 'then', 'time', 'times', 'trap', 'true', 'type', 'typeset',
+    'ulimit', 'umask', 'unalias', 'unset', 'until', 'wait', 'while',
+))
 
 
 def get_common_commands() -> Dict[str, List[Dict[str, str]]]:
     """
     Get a list of common useful commands organized by category
     
+    The catalog itself is built once at import; each call returns a fresh
+    copy, so changes made by the caller do not leak into later calls.
+    
     Returns:
         dict: Dictionary of command categories with command details
     
@@ -19,194 +245,45 @@ def get_common_commands() -> Dict[str, List[Dict[str, str]]]:
         >>> commands = get_common_commands()
         >>> print(commands['file_operations'])
     """
-    commands = {
-        "file_operations": [
-            {
-                "command": "ls -lah",
-                "description": "List all files with details and hidden files",
-                "platform": "Linux/Mac"
-            },
-            {
-                "command": "dir",
-                "description": "List files in directory",
-                "platform": "Windows"
-            },
-            {
-                "command": "cp -r source dest",
-                "description": "Copy directory recursively",
-                "platform": "Linux/Mac"
-            },
-            {
-                "command": "mv source dest",
-                "description": "Move or rename files",
-                "platform": "Linux/Mac"
-            },
-            {
-                "command": "rm -rf directory",
-                "description": "Remove directory and contents",
-                "platform": "Linux/Mac"
-            },
-            {
-                "command": "find . -name '*.txt'",
-                "description": "Find all .txt files in current directory",
-                "platform": "Linux/Mac"
-            }
-        ],
-        "system_info": [
-            {
-                "command": "uname -a",
-                "description": "Display system information",
-                "platform": "Linux/Mac"
-            },
-            {
-                "command": "systeminfo",
-                "description": "Display detailed system information",
-                "platform": "Windows"
-            },
-            {
-                "command": "df -h",
-                "description": "Display disk usage in human-readable format",
-                "platform": "Linux/Mac"
-            },
-            {
-                "command": "free -h",
-                "description": "Display memory usage",
-                "platform": "Linux"
-            },
-            {
-                "command": "top",
-                "description": "Display running processes",
-                "platform": "Linux/Mac"
-            }
-        ],
-        "network": [
-            {
-                "command": "ping google.com",
-                "description": "Test network connectivity",
-                "platform": "All"
-            },
-            {
-                "command": "curl -I https://example.com",
-                "description": "Get HTTP headers from URL",
-                "platform": "Linux/Mac"
-            },
-            {
-                "command": "wget https://example.com/file",
-                "description": "Download file from URL",
-                "platform": "Linux/Mac"
-            },
-            {
-                "command": "ifconfig",
-                "description": "Display network interface configuration",
-                "platform": "Linux/Mac"
-            },
-            {
-                "command": "ipconfig",
-                "description": "Display network configuration",
-                "platform": "Windows"
-            }
-        ],
-        "git": [
-            {
-                "command": "git status",
-                "description": "Check repository status",
-                "platform": "All"
-            },
-            {
-                "command": "git add .",
-                "description": "Stage all changes",
-                "platform": "All"
-            },
-            {
-                "command": "git commit -m 'message'",
-                "description": "Commit staged changes",
-                "platform": "All"
-            },
-            {
-                "command": "git push",
-                "description": "Push commits to remote",
-                "platform": "All"
-            },
-            {
-                "command": "git pull",
-                "description": "Pull changes from remote",
-                "platform": "All"
-            },
-            {
-                "command": "git log --oneline",
-                "description": "View commit history (compact)",
-                "platform": "All"
-            }
-        ],
-        "package_management": [
-            {
-                "command": "pip install package_name",
-                "description": "Install Python package",
-                "platform": "All"
-            },
-            {
-                "command": "npm install package_name",
-                "description": "Install Node.js package",
-                "platform": "All"
-            },
-            {
-                "command": "apt-get update && apt-get install package",
-                "description": "Update and install package (Debian/Ubuntu)",
-                "platform": "Linux"
-            },
-            {
-                "command": "brew install package",
-                "description": "Install package using Homebrew",
-                "platform": "Mac"
-            }
-        ],
-        "compression": [
-            {
-                "command": "tar -czf archive.tar.gz folder/",
-                "description": "Create compressed tar.gz archive",
-                "platform": "Linux/Mac"
-            },
-            {
-                "command": "tar -xzf archive.tar.gz",
-                "description": "Extract tar.gz archive",
-                "platform": "Linux/Mac"
-            },
-            {
-                "command": "zip -r archive.zip folder/",
-                "description": "Create zip archive",
-                "platform": "All"
-            },
-            {
-                "command": "unzip archive.zip",
-                "description": "Extract zip archive",
-                "platform": "All"
-            }
-        ],
-        "text_processing": [
-            {
-                "command": "grep 'pattern' file.txt",
-                "description": "Search for pattern in file",
-                "platform": "Linux/Mac"
-            },
-            {
-                "command": "sed 's/old/new/g' file.txt",
-                "description": "Replace text in file",
-                "platform": "Linux/Mac"
-            },
-            {
-                "command": "awk '{print $1}' file.txt",
-                "description": "Print first column of file",
-                "platform": "Linux/Mac"
-            },
-            {
-                "command": "cat file1.txt file2.txt > combined.txt",
-                "description": "Concatenate files",
-                "platform": "Linux/Mac"
-            }
-        ]
+    return {
+        name: [dict(cmd) for cmd in commands]
+        for name, commands in _COMMON_COMMANDS.items()
     }
+
+
+def get_commands_for_category(category: str) -> Optional[List[Dict[str, str]]]:
+    """
+    Get the common commands for a single category
+    
+    Args:
+        category: Category name (e.g., 'file_operations', 'git')
+    
+    Returns:
+        list or None: Copies of the command details for the category, or
+                      None if the category does not exist
+    
+    Example:
+        >>> for cmd in get_commands_for_category('git'):
+        ...     print(cmd['command'])
+    """
+    commands = _COMMON_COMMANDS.get(category)
+    if commands is None:
+        return None
+    return [dict(cmd) for cmd in commands]
+
+
+def _run(args, shell: bool, capture_output: bool):
+    """Run a command with subprocess.run, optionally capturing text output"""
+    import subprocess
     
-    return commands
+    if capture_output:
+        return subprocess.run(
+            args,
+            shell=shell,
+            capture_output=True,
+            text=True
+        )
+    return subprocess.run(args, shell=shell)
 
 
 def execute_command(command: str, shell: bool = True, capture_output: bool = True) -> Dict[str, any]:
@@ -227,15 +304,21 @@ def execute_command(command: str, shell: bool = True, capture_output: bool = Tru
         ...     print(result['stdout'])
     """
     try:
-        if capture_output:
-            result = subprocess.run(
-                command,
-                shell=shell,
-                capture_output=True,
-                text=True
-            )
-        else:
-            result = subprocess.run(command, shell=shell)
+        result = None
+        if shell and os.name == 'posix' and not _NEEDS_SHELL.search(command):
+            # Nothing for the shell to expand, so skip the extra /bin/sh process
+            argv = shlex.split(command)
+            # Builtins, keywords and VAR=value prefixes mean something only to the shell
+            if argv and argv[0] not in _SHELL_BUILTINS and '=' not in argv[0]:
+                try:
+                    result = _run(argv, False, capture_output)
+                except OSError:
+                    # Unknown programs are left to the shell so they fail
+                    # exactly as before
+                    result = None
+        
+        if result is None:
+            result = _run(command, shell, capture_output)
         
         return {
             'returncode': result.returncode,
@@ -252,10 +335,284 @@ def execute_command(command: str, shell: bool = True, capture_output: bool = Tru
         }
 
 
-def get_system_info() -> Dict[str, str]:
+def execute_commands(commands: List[str], stop_on_error: bool = True) -> List[Dict[str, any]]:
+    """
+    Execute several shell commands in a single shell process
+    
+    Preferred over calling execute_command() in a loop for independent
+    steps: all commands share one shell, so the fork/exec cost is paid once
+    instead of once per command. Output is still reported per command.
+    Commands run in the same shell, so ``cd`` and variable assignments carry
+    over to later commands, and a command that calls ``exit`` ends the batch.
+    
+    Args:
+        commands: Commands to execute, in order
+        stop_on_error: Stop at the first command that fails (default: True)
+    
+    Returns:
+        list: One dictionary per command that ran, each with 'returncode',
+              'stdout', 'stderr', and 'success' keys
+    
+    Example:
+        >>> results = execute_commands(['mkdir -p build', 'ls build'])
+        >>> all(r['success'] for r in results)
+        True
+    """
+    import subprocess
+    import uuid
+    
+    if not commands:
+        return []
+    
+    # Each command is followed by a unique marker carrying its exit status,
+    # which lets the combined output be split back into per-command results.
+    # As in ShellSession.run(), 'command eval' parses each command on its own,
+    # so an unterminated quote fails that command instead of swallowing the
+    # markers after it
+    marker = f"__CMD_SEP_{uuid.uuid4().hex}__"
+    script = []
+    for command in commands:
+        script.append(f"command eval {shlex.quote(command.strip() or ':')}")
+        script.append('__rc=$?')
+        script.append(f"printf '\\n{marker}:%d\\n' \"$__rc\"")
+        script.append(f"printf '\\n{marker}\\n' >&2")
+        if stop_on_error:
+            script.append('[ "$__rc" -eq 0 ] || exit "$__rc"')
+    
+    try:
+        result = subprocess.run(
+            '\n'.join(script),
+            shell=True,
+            capture_output=True,
+            text=True
+        )
+    except Exception as e:
+        return [{
+            'returncode': -1,
+            'stdout': None,
+            'stderr': str(e),
+            'success': False
+        }]
+    
+    stdout_parts = re.split(rf"\n{marker}:(\d+)\n", result.stdout)
+    stderr_parts = result.stderr.split(f"\n{marker}\n")
+    
+    results = []
+    for i in range(len(stdout_parts) // 2):
+        returncode = int(stdout_parts[2 * i + 1])
+        results.append({
+            'returncode': returncode,
+            'stdout': stdout_parts[2 * i],
+            'stderr': stderr_parts[i] if i < len(stderr_parts) else '',
+            'success': returncode == 0
+        })
+    
+    # A command that terminated the shell itself never printed its marker
+    if len(results) < len(commands) and (not results or results[-1]['success']):
+        results.append({
+            'returncode': result.returncode,
+            'stdout': stdout_parts[-1],
+            'stderr': stderr_parts[-1],
+            'success': result.returncode == 0
+        })
+    
+    return results
+
+
+class ShellSession:
+    """
+    Run many commands through one long-lived shell process
+    
+    execute_command() starts a new process for every call. A session keeps a
+    single shell open over pipes instead, so each command costs a pipe write
+    rather than a fork/exec. Because the shell persists, ``cd`` and variable
+    assignments carry over between commands. Commands get /dev/null as their
+    standard input. POSIX only.
+    
+    Each command is handed to the shell through ``eval``, so one that does not
+    parse (an unterminated quote, an unclosed ``if``) fails with a non-zero
+    return code instead of leaving the shell waiting for more input. A command
+    that runs past the timeout is killed together with the shell, and a fresh
+    shell is started; ``cd`` and variables set earlier are lost at that point.
+    
+    Example:
+        >>> with ShellSession() as session:
+        ...     session.run('cd /tmp')
+        ...     result = session.run('pwd')
+        >>> result['stdout']
+        '/tmp\\n'
+    """
+    
+    def __init__(self, shell: str = '/bin/sh', timeout: Optional[float] = None):
+        """
+        Args:
+            shell: Shell to run the commands in (default: /bin/sh)
+            timeout: Default timeout in seconds for each run() (default: None,
+                     wait as long as the command runs)
+        """
+        self._shell = shell
+        self._timeout = timeout
+        self._start()
+    
+    def _start(self) -> None:
+        """Start the shell process"""
+        import subprocess
+        
+        self._process = subprocess.Popen(
+            [self._shell],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True
+        )
+    
+    def _restart(self) -> None:
+        """Kill the shell (and whatever it is running) and start a new one"""
+        import signal
+        
+        # The shell leads its own process group, so this reaches its children too
+        try:
+            os.killpg(self._process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        self._process.wait()
+        self._process.stdin.close()
+        self._process.stdout.close()
+        self._process.stderr.close()
+        self._start()
+    
+    def run(self, command: str, timeout: Optional[float] = None) -> Dict[str, any]:
+        """
+        Execute a command in the session's shell
+        
+        Args:
+            command: Command to execute
+            timeout: Seconds to wait before killing the command and restarting
+                     the shell (default: the session's timeout)
+        
+        Returns:
+            dict: Dictionary with 'returncode', 'stdout', 'stderr', and 'success' keys
+        """
+        import selectors
+        import time
+        import uuid
+        
+        try:
+            if self._process.poll() is not None:
+                raise RuntimeError("shell session is closed")
+            
+            if timeout is None:
+                timeout = self._timeout
+            deadline = None if timeout is None else time.monotonic() + timeout
+            
+            # A unique marker on each stream tells us where this command's
+            # output ends; stdout's marker also carries the exit status.
+            # 'command eval' parses the quoted text only once it is running,
+            # so a syntax error is just a failed command, and 'command' stops
+            # a failing special built-in from exiting a POSIX shell
+            marker = f"__CMD_END_{uuid.uuid4().hex}__".encode()
+            script = (
+                b"command eval " + shlex.quote(command.strip() or ':').encode() + b" < /dev/null\n"
+                b"__rc=$?\n"
+                b"printf '\\n" + marker + b":%d\\n' \"$__rc\"\n"
+                b"printf '\\n" + marker + b"\\n' >&2\n"
+            )
+            self._process.stdin.write(script)
+            self._process.stdin.flush()
+            
+            stdout_end = re.compile(b"\n" + marker + b":(-?\\d+)\n")
+            # Longest stdout marker line, status included; a match can start
+            # at most this far back from the end of what was already scanned
+            stdout_end_width = len(marker) + 24
+            stderr_end = b"\n" + marker + b"\n"
+            stdout = self._process.stdout
+            buffers = {stdout: bytearray(), self._process.stderr: bytearray()}
+            returncode = None
+            stderr_done = False
+            
+            with selectors.DefaultSelector() as selector:
+                for stream in buffers:
+                    selector.register(stream, selectors.EVENT_READ)
+                
+                while selector.get_map():
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        self._restart()
+                        return {
+                            'returncode': -1,
+                            'stdout': buffers[stdout].decode(errors='replace'),
+                            'stderr': f"Command timed out after {timeout} seconds; shell restarted",
+                            'success': False
+                        }
+                    
+                    for key, _ in selector.select(remaining):
+                        stream = key.fileobj
+                        chunk = os.read(stream.fileno(), 65536)
+                        if not chunk:
+                            # The command ended the shell (e.g. via exit)
+                            selector.unregister(stream)
+                            continue
+                        
+                        buffer = buffers[stream]
+                        buffer += chunk
+                        if stream is stdout:
+                            # Only rescan the tail that could hold the marker,
+                            # so large outputs stay linear
+                            start = max(0, len(buffer) - len(chunk) - stdout_end_width)
+                            match = stdout_end.search(buffer, start)
+                            if match:
+                                returncode = int(match.group(1))
+                                del buffer[match.start():]
+                                selector.unregister(stream)
+                        elif buffer.endswith(stderr_end):
+                            stderr_done = True
+                            del buffer[-len(stderr_end):]
+                            selector.unregister(stream)
+            
+            if returncode is None or not stderr_done:
+                returncode = self._process.wait()
+            
+            return {
+                'returncode': returncode,
+                'stdout': buffers[stdout].decode(errors='replace'),
+                'stderr': buffers[self._process.stderr].decode(errors='replace'),
+                'success': returncode == 0
+            }
+        except Exception as e:
+            return {
+                'returncode': -1,
+                'stdout': None,
+                'stderr': str(e),
+                'success': False
+            }
+    
+    def close(self) -> None:
+        """Shut down the shell process"""
+        if self._process.poll() is None:
+            self._process.stdin.close()
+            self._process.wait()
+        self._process.stdout.close()
+        self._process.stderr.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def get_system_info(full: bool = True) -> Dict[str, str]:
     """
     Get detailed system information
     
+    The information cannot change while the process runs, so it is gathered
+    once; each call returns a fresh copy that the caller is free to modify.
+    
+    Args:
+        full: Include the processor name, which is slow to look up on some
+              platforms (default: True)
+    
     Returns:
         dict: Dictionary with system information
     
@@ -263,19 +620,37 @@ def get_system_info() -> Dict[str, str]:
         >>> info = get_system_info()
         >>> print(f"OS: {info['system']} {info['release']}")
     """
+    return dict(_system_info(full))
+
+
+@lru_cache(maxsize=None)
+def _system_info(full: bool) -> Mapping[str, str]:
+    """Collect the information returned by get_system_info()"""
+    import platform
+    
     try:
+        if hasattr(os, 'uname'):
+            # One uname() call instead of one per platform.* helper
+            uname = os.uname()
+            system, node = uname.sysname, uname.nodename
+            release, version, machine = uname.release, uname.version, uname.machine
+        else:
+            system, node = platform.system(), platform.node()
+            release, version, machine = platform.release(), platform.version(), platform.machine()
+        
         info = {
-            'system': platform.system(),
-            'release': platform.release(),
-            'version': platform.version(),
-            'machine': platform.machine(),
-            'processor': platform.processor(),
-            'python_version': platform.python_version(),
-            'hostname': platform.node(),
+            'system': system,
+            'release': release,
+            'version': version,
+            'machine': machine,
         }
+        if full:
+            info['processor'] = platform.processor()
+        info['python_version'] = platform.python_version()
+        info['hostname'] = node
         
         # Add platform-specific information
-        if platform.system() == 'Linux':
+        if system == 'Linux':
             try:
                 with open('/etc/os-release', 'r') as f:
                     for line in f:
@@ -285,9 +660,21 @@ def get_system_info() -> Dict[str, str]:
             except:
                 pass
         
-        return info
+        return MappingProxyType(info)
     except Exception as e:
-        return {'error': str(e)}
+        return MappingProxyType({'error': str(e)})
+
+
+def _format_category(name: str, commands: Tuple[Dict[str, str], ...]) -> str:
+    """Render one command category as printed by print_commands_by_category()"""
+    rule = '=' * 60
+    lines = [f"\n{rule}", name.upper().replace('_', ' '), f"{rule}\n"]
+    for cmd in commands:
+        lines.append(f"Command:     {cmd['command']}")
+        lines.append(f"Description: {cmd['description']}")
+        lines.append(f"Platform:    {cmd['platform']}")
+        lines.append('-' * 60)
+    return "\n".join(lines) + "\n"
 
 
 def print_commands_by_category(category: Optional[str] = None) -> None:
@@ -301,30 +688,16 @@ def print_commands_by_category(category: Optional[str] = None) -> None:
         >>> print_commands_by_category('git')
         >>> print_commands_by_category()  # Print all categories
     """
-    commands = get_common_commands()
+    commands = _COMMON_COMMANDS
     
     if category:
         if category in commands:
-            print(f"\n{'=' * 60}")
-            print(f"{category.upper().replace('_', ' ')}")
-            print(f"{'=' * 60}\n")
-            
-            for cmd in commands[category]:
-                print(f"Command:     {cmd['command']}")
-                print(f"Description: {cmd['description']}")
-                print(f"Platform:    {cmd['platform']}")
-                print("-" * 60)
+            sys.stdout.write(_format_category(category, commands[category]))
         else:
             print(f"✗ Category '{category}' not found")
             print(f"Available categories: {', '.join(commands.keys())}")
     else:
-        for cat_name, cat_commands in commands.items():
-            print(f"\n{'=' * 60}")
-            print(f"{cat_name.upper().replace('_', ' ')}")
-            print(f"{'=' * 60}\n")
-            
-            for cmd in cat_commands:
-                print(f"Command:     {cmd['command']}")
-                print(f"Description: {cmd['description']}")
-                print(f"Platform:    {cmd['platform']}")
-                print("-" * 60)
+        sys.stdout.write("".join(
+            _format_category(cat_name, cat_commands)
+            for cat_name, cat_commands in commands.items()
+        ))
@@ -1,11 +1,18 @@
 """Data utility functions"""
 
-from .data_utils import (
-    read_json, write_json, pretty_print_json, read_csv, write_csv,
-    json_to_csv, csv_to_json, flatten_dict, merge_dicts, filter_dict
-)
+import importlib
 
 __all__ = [
-    'read_json', 'write_json', 'pretty_print_json', 'read_csv', 'write_csv',
-    'json_to_csv', 'csv_to_json', 'flatten_dict', 'merge_dicts', 'filter_dict'
+    'read_json', 'read_json_many', 'write_json', 'pretty_print_json', 'read_csv',
+    'write_csv', 'json_to_csv', 'csv_to_json', 'flatten_dict', 'merge_dicts',
+    'filter_dict'
 ]
+
+
+def __getattr__(name):
+    # Import data_utils on first use rather than when the package is imported
+    if name in __all__:
+        value = getattr(importlib.import_module('.data_utils', __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
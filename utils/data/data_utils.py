@@ -3,14 +3,54 @@ Data manipulation utility functions (JSON, CSV, etc.)
 """
 
 import json
-import csv
+import logging
+import re
+from itertools import chain
+from operator import itemgetter
 from typing import Any, List, Dict, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# orjson turns integers beyond 64 bits into floats; any run of this many
+# digits might be one, so such input is parsed with json instead
+_LONG_DIGITS = re.compile(rb'\d{19}')
+
+
+def _dumps(data: Any, indent: Optional[int]) -> bytes:
+    """Serialize data to UTF-8 JSON, using orjson when it can produce the same layout"""
+    # orjson only supports two-space indentation
+    if orjson is not None and indent == 2:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # Non-string keys, integers over 64 bits, etc.
+            pass
+    return json.dumps(data, indent=indent, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed and gives the same result"""
+    if orjson is not None and not _LONG_DIGITS.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals are only accepted by the json module
+            pass
+    return json.loads(raw)
+
 
 def read_json(file_path: str) -> Any:
     """
     Read JSON data from a file
     
+    Uses orjson for parsing when it is installed. Files with very long
+    integers are parsed with json, which keeps them exact.
+    
     Args:
         file_path: Path to JSON file
     
@@ -21,17 +61,46 @@ def read_json(file_path: str) -> Any:
         >>> data = read_json('data.json')
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            return _loads(f.read())
     except Exception as e:
-        print(f"✗ Error reading JSON: {e}")
+        logger.error("Error reading JSON: %s", e)
         return None
 
 
+def read_json_many(file_paths: List[str], workers: int = 8) -> List[Any]:
+    """
+    Read many JSON files concurrently
+    
+    File reads overlap on a thread pool, which helps when loading lots of
+    small files where open/read latency dominates.
+    
+    Args:
+        file_paths: Paths to JSON files
+        workers: Maximum number of reader threads (default: 8)
+    
+    Returns:
+        list: Parsed JSON data for each path, in order (None for files that
+              could not be read)
+    
+    Example:
+        >>> configs = read_json_many(['a.json', 'b.json'])
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(read_json, file_paths))
+
+
 def write_json(data: Any, file_path: str, indent: int = 2) -> bool:
     """
     Write data to a JSON file
     
+    Uses orjson for serialization when it is installed and indent is 2.
+    Note that orjson writes NaN and Infinity as null, and writes floats in
+    exponent form without the '+' and zero padding json uses (1e16, not
+    1e+16); the values read back the same.
+    
     Args:
         data: Data to write
         file_path: Path to output JSON file
@@ -45,12 +114,12 @@ def write_json(data: Any, file_path: str, indent: int = 2) -> bool:
         True
     """
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
-        print(f"✓ JSON written to {file_path}")
+        with open(file_path, 'wb') as f:
+            f.write(_dumps(data, indent))
+        logger.debug("JSON written to %s", file_path)
         return True
     except Exception as e:
-        print(f"✗ Error writing JSON: {e}")
+        logger.error("Error writing JSON: %s", e)
         return False
 
 
@@ -69,7 +138,7 @@ def pretty_print_json(data: Any, indent: int = 2) -> None:
           "age": 30
         }
     """
-    print(json.dumps(data, indent=indent, ensure_ascii=False))
+    print(_dumps(data, indent).decode('utf-8'))
 
 
 def read_csv(file_path: str, has_header: bool = True) -> List[Dict[str, str]]:
@@ -88,6 +157,8 @@ def read_csv(file_path: str, has_header: bool = True) -> List[Dict[str, str]]:
         >>> print(data[0])
         {'name': 'John', 'age': '30'}
     """
+    import csv
+    
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             if has_header:
@@ -97,10 +168,39 @@ def read_csv(file_path: str, has_header: bool = True) -> List[Dict[str, str]]:
                 reader = csv.reader(f)
                 return list(reader)
     except Exception as e:
-        print(f"✗ Error reading CSV: {e}")
+        logger.error("Error reading CSV: %s", e)
         return []
 
 
+def _row_extractor(fieldnames: List[str]):
+    """
+    Build a function turning a dict into a tuple of values in fieldnames order
+    
+    Rows holding exactly the given fields take a single itemgetter call.
+    Other rows follow csv.DictWriter's rules: missing fields become empty
+    strings and unknown fields raise ValueError.
+    """
+    getter = itemgetter(*fieldnames)
+    single = len(fieldnames) == 1
+    field_set = set(fieldnames)
+    field_count = len(field_set)
+    
+    def extract(row):
+        if len(row) == field_count:
+            try:
+                values = getter(row)
+                return (values,) if single else values
+            except KeyError:
+                pass
+        wrong_fields = row.keys() - field_set
+        if wrong_fields:
+            raise ValueError("dict contains fields not in fieldnames: "
+                             + ", ".join([repr(x) for x in wrong_fields]))
+        return tuple(row.get(key, '') for key in fieldnames)
+    
+    return extract
+
+
 def write_csv(data: List[Dict[str, Any]], file_path: str, fieldnames: Optional[List[str]] = None) -> bool:
     """
     Write data to a CSV file
@@ -118,23 +218,25 @@ def write_csv(data: List[Dict[str, Any]], file_path: str, fieldnames: Optional[L
         >>> write_csv(data, 'output.csv')
         True
     """
+    import csv
+    
     try:
         if not data:
-            print("✗ No data to write")
+            logger.error("No data to write")
             return False
         
         if fieldnames is None:
             fieldnames = list(data[0].keys())
         
         with open(file_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(map(_row_extractor(fieldnames), data))
         
-        print(f"✓ CSV written to {file_path}")
+        logger.debug("CSV written to %s", file_path)
         return True
     except Exception as e:
-        print(f"✗ Error writing CSV: {e}")
+        logger.error("Error writing CSV: %s", e)
         return False
 
 
@@ -142,6 +244,9 @@ def json_to_csv(json_file: str, csv_file: str) -> bool:
     """
     Convert JSON file to CSV
     
+    If the optional ``ijson`` package is installed, the top-level array is
+    parsed incrementally so only one object is held in memory at a time.
+    
     Args:
         json_file: Path to input JSON file
         csv_file: Path to output CSV file
@@ -153,14 +258,41 @@ def json_to_csv(json_file: str, csv_file: str) -> bool:
         >>> json_to_csv('data.json', 'data.csv')
         True
     """
-    data = read_json(json_file)
-    if data is None:
-        return False
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+    
+    if ijson is None:
+        data = read_json(json_file)
+        if data is None:
+            return False
+        
+        if isinstance(data, list):
+            return write_csv(data, csv_file)
+        else:
+            logger.error("JSON data must be a list of objects")
+            return False
     
-    if isinstance(data, list):
-        return write_csv(data, csv_file)
-    else:
-        print("✗ JSON data must be a list of objects")
+    try:
+        with open(json_file, 'rb') as f:
+            first_char = f.read(1)
+            while first_char.isspace():
+                first_char = f.read(1)
+            if first_char != b'[':
+                logger.error("JSON data must be a list of objects")
+                return False
+            f.seek(0)
+            
+            rows = ijson.items(f, 'item', use_float=True)
+            first = next(rows, None)
+            if first is None:
+                logger.error("No data to write")
+                return False
+            
+            return write_csv(chain([first], rows), csv_file, fieldnames=list(first.keys()))
+    except Exception as e:
+        logger.error("Error reading JSON: %s", e)
         return False
 
 
@@ -168,6 +300,9 @@ def csv_to_json(csv_file: str, json_file: str) -> bool:
     """
     Convert CSV file to JSON
     
+    Rows are written to the output array as they are read, so memory use
+    stays constant regardless of the size of the CSV file.
+    
     Args:
         csv_file: Path to input CSV file
         json_file: Path to output JSON file
@@ -179,11 +314,30 @@ def csv_to_json(csv_file: str, json_file: str) -> bool:
         >>> csv_to_json('data.csv', 'data.json')
         True
     """
-    data = read_csv(csv_file)
-    if not data:
-        return False
+    import csv
     
-    return write_json(data, json_file)
+    try:
+        with open(csv_file, 'r', encoding='utf-8') as src:
+            rows = csv.DictReader(src)
+            first = next(rows, None)
+            if first is None:
+                return False
+            
+            # Same layout as write_json(), one row at a time
+            pad = '  '
+            with open(json_file, 'w', encoding='utf-8') as dst:
+                dst.write('[\n')
+                for i, row in enumerate(chain([first], rows)):
+                    if i:
+                        dst.write(',\n')
+                    dst.write(pad + json.dumps(row, indent=2, ensure_ascii=False).replace('\n', '\n' + pad))
+                dst.write('\n]')
+        
+        logger.debug("JSON written to %s", json_file)
+        return True
+    except Exception as e:
+        logger.error("Error converting CSV to JSON: %s", e)
+        return False
 
 
 def flatten_dict(d: Dict, parent_key: str = '', sep: str = '.') -> Dict:
@@ -192,7 +346,7 @@ def flatten_dict(d: Dict, parent_key: str = '', sep: str = '.') -> Dict:
     
     Args:
         d: Dictionary to flatten
-        parent_key: Parent key for recursion
+        parent_key: Prefix for all keys (default: none)
         sep: Separator for keys (default: '.')
     
     Returns:
@@ -202,14 +356,21 @@ def flatten_dict(d: Dict, parent_key: str = '', sep: str = '.') -> Dict:
         >>> flatten_dict({'a': {'b': 1, 'c': 2}})
         {'a.b': 1, 'a.c': 2}
     """
-    items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, new_key, sep=sep).items())
+    result = {}
+    # Stack of (key prefix, items iterator) pairs; descending into a nested
+    # dict pauses the parent's iterator, which keeps the original key order
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            new_key = f"{prefix}{sep}{k}" if prefix else k
+            if isinstance(v, dict):
+                stack.append((new_key, iter(v.items())))
+                break
+            result[new_key] = v
         else:
-            items.append((new_key, v))
-    return dict(items)
+            stack.pop()
+    return result
 
 
 def merge_dicts(*dicts: Dict) -> Dict:
@@ -226,8 +387,12 @@ def merge_dicts(*dicts: Dict) -> Dict:
         >>> merge_dicts({'a': 1}, {'b': 2}, {'c': 3})
         {'a': 1, 'b': 2, 'c': 3}
     """
-    result = {}
-    for d in dicts:
+    if not dicts:
+        return {}
+    # Copying the first dict is a single C-level operation, so only the
+    # remaining dicts need an update() pass
+    result = dict(dicts[0])
+    for d in dicts[1:]:
         result.update(d)
     return result
 
@@ -247,4 +412,10 @@ def filter_dict(d: Dict, keys: List[str]) -> Dict:
         >>> filter_dict({'a': 1, 'b': 2, 'c': 3}, ['a', 'c'])
         {'a': 1, 'c': 3}
     """
+    if not isinstance(keys, (set, frozenset, dict)):
+        try:
+            keys = frozenset(keys)
+        except TypeError:
+            # Unhashable entries can't match a dict key; keep list membership
+            pass
     return {k: v for k, v in d.items() if k in keys}
@@ -1,13 +1,19 @@
 """Date and time utility functions"""
 
-from .datetime_utils import (
-    get_current_timestamp, get_current_date, get_current_time, parse_date,
-    format_date, add_days, add_hours, calculate_age, days_between,
-    is_weekend, get_day_name, get_month_name, time_ago
-)
+import importlib
 
 __all__ = [
     'get_current_timestamp', 'get_current_date', 'get_current_time', 'parse_date',
-    'format_date', 'add_days', 'add_hours', 'calculate_age', 'days_between',
-    'is_weekend', 'get_day_name', 'get_month_name', 'time_ago'
+    'format_date', 'add_days', 'add_hours', 'calculate_age', 'calculate_ages',
+    'days_between', 'days_between_array', 'is_weekend', 'get_day_name',
+    'get_month_name', 'time_ago', 'time_ago_bulk'
 ]
+
+
+def __getattr__(name):
+    # Import datetime_utils on first use rather than when the package is imported
+    if name in __all__:
+        value = getattr(importlib.import_module('.datetime_utils', __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
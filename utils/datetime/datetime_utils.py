@@ -2,8 +2,42 @@
 Date and time utility functions
 """
 
+import calendar
+import logging
+from bisect import bisect_right
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Day and month names, looked up once instead of via strftime on every call
+_DAY_NAMES = tuple(calendar.day_name)
+_MONTH_NAMES = tuple(calendar.month_name)
+
+# time_ago() buckets: a difference below _TIME_AGO_THRESHOLDS[i] is reported
+# using _TIME_AGO_UNITS[i] as (seconds per unit, singular label, plural label)
+_TIME_AGO_THRESHOLDS = (60, 3600, 86400)
+_TIME_AGO_UNITS = (
+    (1, 'seconds', 'seconds'),
+    (60, 'minute', 'minutes'),
+    (3600, 'hour', 'hours'),
+    (86400, 'day', 'days'),
+)
+
+
+def _now() -> datetime:
+    """Read the current local time"""
+    return datetime.now()
+
+
+def _strftime(dt: datetime, format: str) -> str:
+    """Format a date/time, skipping strftime for the default date and time formats"""
+    # strftime does not zero-pad years below 1000, so leave those to it
+    if format == "%Y-%m-%d" and dt.year >= 1000:
+        return f"{dt.year}-{dt.month:02d}-{dt.day:02d}"
+    if format == "%H:%M:%S" and isinstance(dt, datetime):
+        return f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    return dt.strftime(format)
 
 
 def get_current_timestamp() -> str:
@@ -18,7 +52,7 @@ def get_current_timestamp() -> str:
         >>> print(timestamp)
         '2025-10-27T12:00:00'
     """
-    return datetime.now().isoformat()
+    return _now().isoformat()
 
 
 def get_current_date(format: str = "%Y-%m-%d") -> str:
@@ -35,7 +69,7 @@ def get_current_date(format: str = "%Y-%m-%d") -> str:
         >>> get_current_date()
         '2025-10-27'
     """
-    return datetime.now().strftime(format)
+    return _strftime(_now(), format)
 
 
 def get_current_time(format: str = "%H:%M:%S") -> str:
@@ -52,7 +86,7 @@ def get_current_time(format: str = "%H:%M:%S") -> str:
         >>> get_current_time()
         '12:00:00'
     """
-    return datetime.now().strftime(format)
+    return _strftime(_now(), format)
 
 
 def parse_date(date_string: str, format: str = "%Y-%m-%d") -> Optional[datetime]:
@@ -71,10 +105,19 @@ def parse_date(date_string: str, format: str = "%Y-%m-%d") -> Optional[datetime]
         >>> print(dt)
         2025-10-27 00:00:00
     """
+    # fromisoformat is much faster than strptime but accepts more than
+    # YYYY-MM-DD, so only use it on strings of exactly that shape
+    if (format == "%Y-%m-%d" and len(date_string) == 10
+            and date_string[4] == '-' and date_string[7] == '-'):
+        try:
+            return datetime.fromisoformat(date_string)
+        except ValueError:
+            pass
+    
     try:
         return datetime.strptime(date_string, format)
     except ValueError as e:
-        print(f"✗ Error parsing date: {e}")
+        logger.error("Error parsing date: %s", e)
         return None
 
 
@@ -94,7 +137,7 @@ def format_date(dt: datetime, format: str = "%Y-%m-%d") -> str:
         >>> format_date(dt, "%B %d, %Y")
         'October 27, 2025'
     """
-    return dt.strftime(format)
+    return _strftime(dt, format)
 
 
 def add_days(days: int, start_date: Optional[datetime] = None) -> datetime:
@@ -114,7 +157,7 @@ def add_days(days: int, start_date: Optional[datetime] = None) -> datetime:
         2025-11-03 ...
     """
     if start_date is None:
-        start_date = datetime.now()
+        start_date = _now()
     return start_date + timedelta(days=days)
 
 
@@ -133,7 +176,7 @@ def add_hours(hours: int, start_time: Optional[datetime] = None) -> datetime:
         >>> future = add_hours(3)
     """
     if start_time is None:
-        start_time = datetime.now()
+        start_time = _now()
     return start_time + timedelta(hours=hours)
 
 
@@ -153,7 +196,7 @@ def calculate_age(birth_date: datetime) -> int:
         >>> print(age)
         35
     """
-    today = datetime.now()
+    today = _now()
     age = today.year - birth_date.year
     if today.month < birth_date.month or (today.month == birth_date.month and today.day < birth_date.day):
         age -= 1
@@ -180,6 +223,73 @@ def days_between(date1: datetime, date2: datetime) -> int:
     return abs((date2 - date1).days)
 
 
+def calculate_ages(birth_dates):
+    """
+    Calculate ages for many birth dates at once using NumPy
+    
+    Vectorized counterpart of calculate_age() for columns of dates.
+    
+    Args:
+        birth_dates: Sequence or array of birth dates (datetime objects,
+                     ISO date strings, or numpy datetime64 values)
+    
+    Returns:
+        numpy.ndarray or None: Ages in years, or None if NumPy is unavailable
+    
+    Example:
+        >>> calculate_ages(['1990-01-01', '2000-06-15'])
+        array([35, 25])
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        logger.error("NumPy not installed. Install with: pip install numpy")
+        return None
+    
+    births = np.asarray(birth_dates, dtype='datetime64[D]')
+    today = np.datetime64(_now().date(), 'D')
+    
+    birth_months = births.astype('datetime64[M]')
+    today_month = today.astype('datetime64[M]')
+    
+    ages = (today.astype('datetime64[Y]') - births.astype('datetime64[Y]')).astype(int)
+    
+    # Subtract a year where this year's birthday hasn't happened yet
+    month_delta = (today_month.astype(int) % 12) - (birth_months.astype(int) % 12)
+    day_delta = (today - today_month).astype(int) - (births - birth_months).astype(int)
+    ages -= (month_delta < 0) | ((month_delta == 0) & (day_delta < 0))
+    return ages
+
+
+def days_between_array(dates1, dates2):
+    """
+    Calculate days between pairs of dates at once using NumPy
+    
+    Vectorized counterpart of days_between() for columns of dates.
+    
+    Args:
+        dates1: Sequence or array of first dates
+        dates2: Sequence or array of second dates (same length as dates1)
+    
+    Returns:
+        numpy.ndarray or None: Number of days (absolute values), or None if
+                               NumPy is unavailable
+    
+    Example:
+        >>> days_between_array(['2025-01-01'], ['2025-01-10'])
+        array([9])
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        logger.error("NumPy not installed. Install with: pip install numpy")
+        return None
+    
+    diff = np.asarray(dates2, dtype='datetime64') - np.asarray(dates1, dtype='datetime64')
+    # Floor to whole days like timedelta.days does, then take the magnitude
+    return np.abs(np.floor_divide(diff, np.timedelta64(1, 'D')))
+
+
 def is_weekend(date: Optional[datetime] = None) -> bool:
     """
     Check if a date is a weekend
@@ -195,7 +305,7 @@ def is_weekend(date: Optional[datetime] = None) -> bool:
         True
     """
     if date is None:
-        date = datetime.now()
+        date = _now()
     return date.weekday() >= 5
 
 
@@ -214,8 +324,8 @@ def get_day_name(date: Optional[datetime] = None) -> str:
         'Monday'
     """
     if date is None:
-        date = datetime.now()
-    return date.strftime("%A")
+        date = _now()
+    return _DAY_NAMES[date.weekday()]
 
 
 def get_month_name(date: Optional[datetime] = None) -> str:
@@ -233,16 +343,17 @@ def get_month_name(date: Optional[datetime] = None) -> str:
         'October'
     """
     if date is None:
-        date = datetime.now()
-    return date.strftime("%B")
+        date = _now()
+    return _MONTH_NAMES[date.month]
 
 
-def time_ago(past_date: datetime) -> str:
+def time_ago(past_date: datetime, now: Optional[datetime] = None) -> str:
     """
     Get human-readable time difference from now
     
     Args:
         past_date: Past datetime
+        now: Reference time (default: current time)
     
     Returns:
         str: Human-readable time difference
@@ -252,19 +363,34 @@ def time_ago(past_date: datetime) -> str:
         >>> time_ago(past)
         '2 hours ago'
     """
-    now = datetime.now()
+    if now is None:
+        now = _now()
     diff = now - past_date
     
     seconds = diff.total_seconds()
     
-    if seconds < 60:
-        return f"{int(seconds)} seconds ago"
-    elif seconds < 3600:
-        minutes = int(seconds / 60)
-        return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-    elif seconds < 86400:
-        hours = int(seconds / 3600)
-        return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    else:
-        days = int(seconds / 86400)
-        return f"{days} day{'s' if days != 1 else ''} ago"
+    unit = bisect_right(_TIME_AGO_THRESHOLDS, seconds)
+    divisor, singular, plural = _TIME_AGO_UNITS[unit]
+    count = int(seconds / divisor)
+    return f"{count} {singular if count == 1 else plural} ago"
+
+
+def time_ago_bulk(past_dates: Iterable[datetime]) -> List[str]:
+    """
+    Get human-readable time differences for many dates at once
+    
+    The clock is read once and shared by every date, so all results are
+    relative to the same moment.
+    
+    Args:
+        past_dates: Past datetimes
+    
+    Returns:
+        list: Human-readable time difference for each date, in order
+    
+    Example:
+        >>> time_ago_bulk([add_hours(-2), add_days(-3)])
+        ['2 hours ago', '3 days ago']
+    """
+    now = _now()
+    return [time_ago(past_date, now) for past_date in past_dates]
@@ -1,5 +1,14 @@
 """File utility functions"""
 
-from .file_utils import copy_files, move_files, delete_files, compress_folder, extract_archive, get_file_size
+import importlib
 
 __all__ = ['copy_files', 'move_files', 'delete_files', 'compress_folder', 'extract_archive', 'get_file_size']
+
+
+def __getattr__(name):
+    # Import file_utils on first use rather than when the package is imported
+    if name in __all__:
+        value = getattr(importlib.import_module('.file_utils', __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
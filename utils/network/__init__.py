@@ -2,12 +2,12 @@
 
 from .network_utils import (
     check_internet_connection, get_ip_address, is_valid_url, parse_url,
-    build_url, get_domain_from_url, encode_url, decode_url, get_hostname,
-    is_port_open
+    build_url, make_url_builder, get_domain_from_url, encode_url, decode_url,
+    get_hostname, is_port_open, is_port_open_many
 )
 
 __all__ = [
     'check_internet_connection', 'get_ip_address', 'is_valid_url', 'parse_url',
-    'build_url', 'get_domain_from_url', 'encode_url', 'decode_url', 'get_hostname',
-    'is_port_open'
+    'build_url', 'make_url_builder', 'get_domain_from_url', 'encode_url', 'decode_url',
+    'get_hostname', 'is_port_open', 'is_port_open_many'
 ]
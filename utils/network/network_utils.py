@@ -2,9 +2,47 @@
 Network and web utility functions
 """
 
+import re
 import socket
+import time
 import urllib.parse
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+_DNS_TTL = 300  # seconds a cached lookup is trusted
+
+
+@lru_cache(maxsize=256)
+def _resolve_cached(host: str, port: int, ttl_bucket: int):
+    return tuple(socket.getaddrinfo(host, port, type=socket.SOCK_STREAM))
+
+
+def _resolve(host: str, port: int):
+    """getaddrinfo for a TCP endpoint, cached for up to _DNS_TTL seconds"""
+    # A new bucket every _DNS_TTL seconds makes older entries unreachable;
+    # lru_cache then ages them out. Failed lookups are never cached.
+    return _resolve_cached(host, port, int(time.monotonic() // _DNS_TTL))
+
+
+# scheme://netloc for the common all-ASCII case. A match gives exactly the
+# netloc urlparse would; anything else falls back to urlparse itself.
+_URL_NETLOC_RE = re.compile(
+    r"[A-Za-z][A-Za-z0-9+.-]*://([A-Za-z0-9._~%!$&'()*+,;=:@-]+)(?:[/?#]|\Z)"
+)
+
+
+def _connect(host: str, port: int, timeout: float) -> bool:
+    """Try each resolved address for host:port until one accepts a TCP connection"""
+    for family, sock_type, proto, _, address in _resolve(host, port):
+        sock = socket.socket(family, sock_type, proto)
+        try:
+            sock.settimeout(timeout)
+            if sock.connect_ex(address) == 0:
+                return True
+        finally:
+            sock.close()
+    return False
 
 
 def check_internet_connection(host: str = "8.8.8.8", port: int = 53, timeout: int = 3) -> bool:
@@ -24,9 +62,7 @@ def check_internet_connection(host: str = "8.8.8.8", port: int = 53, timeout: in
         True
     """
     try:
-        socket.setdefaulttimeout(timeout)
-        socket.socket(socket.AF_INET, socket.SOCK_STREAM).connect((host, port))
-        return True
+        return _connect(host, port, timeout)
     except socket.error:
         return False
 
@@ -54,6 +90,7 @@ def get_ip_address() -> Optional[str]:
         return None
 
 
+@lru_cache(maxsize=4096)
 def is_valid_url(url: str) -> bool:
     """
     Check if a URL is valid
@@ -68,6 +105,8 @@ def is_valid_url(url: str) -> bool:
         >>> is_valid_url("https://example.com")
         True
     """
+    if _URL_NETLOC_RE.match(url):
+        return True
     try:
         result = urllib.parse.urlparse(url)
         return all([result.scheme, result.netloc])
@@ -122,6 +161,54 @@ def build_url(base_url: str, params: Dict[str, str]) -> str:
     return f"{base_url}{separator}{query_string}"
 
 
+@lru_cache(maxsize=8192)
+def _quote_plus_cached(value) -> str:
+    # Real query values repeat heavily (page numbers, flags, common terms)
+    return urllib.parse.quote_plus(value)
+
+
+def make_url_builder(base_url: str, param_keys: List[str]) -> Callable[..., str]:
+    """
+    Precompute a URL builder for an endpoint with a fixed set of query parameters
+    
+    The base URL, separators and quoted keys are joined once up front, so each
+    call only quotes its values. Builds the same URL as build_url with the
+    parameters in param_keys order.
+    
+    Args:
+        base_url: Base URL
+        param_keys: Query parameter names, in the order values will be passed
+    
+    Returns:
+        callable: Function taking one value per key and returning the URL
+    
+    Example:
+        >>> search_url = make_url_builder("https://example.com/search", ["q", "page"])
+        >>> search_url("python", 2)
+        'https://example.com/search?q=python&page=2'
+    """
+    if not param_keys:
+        return lambda: base_url
+    
+    separator = '&' if '?' in base_url else '?'
+    prefixes = tuple(
+        (base_url + separator if i == 0 else '&')
+        + urllib.parse.quote_plus(key if isinstance(key, bytes) else str(key)) + '='
+        for i, key in enumerate(param_keys)
+    )
+    
+    def build(*values) -> str:
+        if len(values) != len(prefixes):
+            raise TypeError(f"expected {len(prefixes)} values, got {len(values)}")
+        return ''.join([
+            prefix + _quote_plus_cached(value if isinstance(value, (str, bytes)) else str(value))
+            for prefix, value in zip(prefixes, values)
+        ])
+    
+    return build
+
+
+@lru_cache(maxsize=4096)
 def get_domain_from_url(url: str) -> Optional[str]:
     """
     Extract domain from URL
@@ -136,6 +223,9 @@ def get_domain_from_url(url: str) -> Optional[str]:
         >>> get_domain_from_url("https://www.example.com/path")
         'www.example.com'
     """
+    match = _URL_NETLOC_RE.match(url)
+    if match:
+        return match.group(1)
     try:
         parsed = urllib.parse.urlparse(url)
         return parsed.netloc
@@ -209,10 +299,54 @@ def is_port_open(host: str, port: int, timeout: int = 2) -> bool:
         False
     """
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        result = sock.connect_ex((host, port))
-        sock.close()
-        return result == 0
+        return _connect(host, port, timeout)
     except:
         return False
+
+
+async def _probe_ports(targets: List[Tuple[str, int]], timeout: float, concurrency: int) -> List[bool]:
+    import asyncio
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def probe(host, port):
+        async with semaphore:
+            try:
+                _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+            except (OSError, ValueError, TypeError, OverflowError, asyncio.TimeoutError):
+                # A bad target only fails its own probe, as with is_port_open()
+                return False
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+            return True
+    
+    return await asyncio.gather(*(probe(host, port) for host, port in targets))
+
+
+def is_port_open_many(targets: Iterable[Tuple[str, int]], timeout: int = 2,
+                      concurrency: int = 256) -> List[bool]:
+    """
+    Check many host/port pairs at once
+    
+    Probes run concurrently on an asyncio event loop, so checking N targets
+    takes about as long as the slowest one instead of the sum of all of them.
+    Call it from synchronous code; it starts and closes its own event loop.
+    
+    Args:
+        targets: (host, port) pairs to check
+        timeout: Timeout in seconds for each probe (default: 2)
+        concurrency: Maximum probes in flight at once (default: 256)
+    
+    Returns:
+        list: True/False for each target, in the order given
+    
+    Example:
+        >>> is_port_open_many([("localhost", 22), ("localhost", 80)])
+        [True, False]
+    """
+    import asyncio
+    
+    return asyncio.run(_probe_ports(list(targets), timeout, concurrency))
@@ -1,15 +1,19 @@
 """Text utility functions"""
 
 from .text_utils import (
-    count_words, count_characters, reverse_text, to_title_case,
-    to_snake_case, to_camel_case, to_kebab_case, remove_extra_spaces,
-    extract_emails, extract_urls, truncate_text, remove_html_tags,
-    count_occurrences, replace_multiple
+    count_words, count_words_batch, count_characters, reverse_text, to_title_case,
+    to_snake_case, to_camel_case, to_kebab_case, to_snake_case_batch,
+    to_camel_case_batch, to_kebab_case_batch, remove_extra_spaces,
+    extract_emails, extract_urls, iter_emails, iter_urls, extract_all,
+    truncate_text, make_truncator, remove_html_tags,
+    count_occurrences, replace_multiple, TextCleaner
 )
 
 __all__ = [
-    'count_words', 'count_characters', 'reverse_text', 'to_title_case',
-    'to_snake_case', 'to_camel_case', 'to_kebab_case', 'remove_extra_spaces',
-    'extract_emails', 'extract_urls', 'truncate_text', 'remove_html_tags',
-    'count_occurrences', 'replace_multiple'
+    'count_words', 'count_words_batch', 'count_characters', 'reverse_text', 'to_title_case',
+    'to_snake_case', 'to_camel_case', 'to_kebab_case', 'to_snake_case_batch',
+    'to_camel_case_batch', 'to_kebab_case_batch', 'remove_extra_spaces',
+    'extract_emails', 'extract_urls', 'iter_emails', 'iter_urls', 'extract_all',
+    'truncate_text', 'make_truncator', 'remove_html_tags',
+    'count_occurrences', 'replace_multiple', 'TextCleaner'
 ]
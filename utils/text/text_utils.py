@@ -2,8 +2,63 @@
 Text and string manipulation utility functions
 """
 
+import logging
 import re
-from typing import List, Optional, Dict
+from functools import lru_cache, wraps
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Compiled once at import instead of going through re's pattern cache per call.
+# A compiled pattern carries no lazily built state, so there is nothing to
+# warm up; a bad pattern already fails here, at import
+_NON_WORD_SPACE_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_WHITESPACE_SPLIT_RE = re.compile(r'(\s+)')
+# extract_emails() finds what r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'
+# matches, but anchored on each '@' rather than letting re retry the local
+# part from every word boundary (quadratic on long runs like 'a.a.a...@')
+_EMAIL_LOCAL_RE = re.compile(r'[A-Za-z0-9._%+-]*')
+_EMAIL_DOMAIN_RE = re.compile(r'[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_WORD_BOUNDARY_RE = re.compile(r'\b')
+# One character class (no per-character alternation) of the characters URLs
+# use; <, >, quotes, brackets and backslashes end a match so surrounding markup
+# isn't swallowed
+_URL_RE = re.compile(r"https?://[A-Za-z0-9$\-_@.&+!*(),%/#?=:;~]+")
+# remove_html_tags() strips what '<.*?>' matches: from a '<' to the first '>'
+# on the same line. Innermost tags (no '<' inside) cover ordinary markup in
+# one fast sub; anything else goes through a tokeniser that keeps an unclosed
+# '<' together with the rest of its line, so it is never rescanned (the lazy
+# pattern rescans to the end of the line from every such '<')
+_INNER_TAG_RE = re.compile(r'<[^\n<>]*>')
+_TAG_OR_TEXT_RE = re.compile(r'<[^\n>]*>|(<[^\n>]*|[^<]+)')
+
+# For ASCII input: drop what _NON_WORD_SPACE_RE would remove and lowercase, in one translate
+_ASCII_SLUG_TABLE = {
+    i: None if _NON_WORD_SPACE_RE.match(chr(i)) else chr(i).lower()
+    for i in range(128)
+}
+
+# count_words() and remove_extra_spaces() split texts longer than this a
+# slice at a time
+_SPLIT_CHUNK = 1 << 16
+
+# The ASCII characters str.split() treats as whitespace
+_ASCII_SPACE_BYTES = tuple(i for i in range(128) if chr(i).isspace())
+_ASCII_SPACE_CHARS = ''.join(map(chr, _ASCII_SPACE_BYTES))
+# The same set as an RE2 character class body, for pyarrow's regex kernels,
+# and a pattern for whitespace other than single spaces
+_RE2_SPACE_CLASS = ''.join(f'\\x{i:02x}' for i in _ASCII_SPACE_BYTES)
+_RE2_NOT_SINGLE_SPACE = '[' + ''.join(f'\\x{i:02x}' for i in _ASCII_SPACE_BYTES if i != 32) + ']|  '
+
+# The case converters remember this many recent results, for texts up to
+# _CASE_CACHE_MAX_LENGTH characters (the same column names or labels tend to
+# be converted over and over)
+_CASE_CACHE_SIZE = 4096
+_CASE_CACHE_MAX_LENGTH = 256
+
+# Compiled by numba on the first count_words_batch() call
+_count_words_kernel = None
 
 
 def count_words(text: str) -> int:
@@ -20,7 +75,21 @@ def count_words(text: str) -> int:
         >>> count_words("Hello world, this is a test")
         6
     """
-    return len(text.split())
+    if len(text) <= _SPLIT_CHUNK:
+        return len(text.split())
+    
+    # Splitting a large text at once builds a string object per word only to
+    # count them; one slice at a time keeps that garbage small (and in cache)
+    count = 0
+    in_word = False
+    for start in range(0, len(text), _SPLIT_CHUNK):
+        chunk = text[start:start + _SPLIT_CHUNK]
+        count += len(chunk.split())
+        # A word running across the slice boundary was counted on both sides
+        if in_word and not chunk[0].isspace():
+            count -= 1
+        in_word = not chunk[-1].isspace()
+    return count
 
 
 def count_characters(text: str, include_spaces: bool = True) -> int:
@@ -43,6 +112,81 @@ def count_characters(text: str, include_spaces: bool = True) -> int:
     return len(text.replace(" ", ""))
 
 
+def _get_count_words_kernel():
+    """Compile (once) the numba kernel behind count_words_batch"""
+    global _count_words_kernel
+    if _count_words_kernel is None:
+        import numba
+        
+        @numba.njit(parallel=True, nogil=True)
+        def kernel(buffer, offsets, is_space, counts):
+            for i in numba.prange(len(counts)):
+                n = 0
+                previous_space = True
+                for j in range(offsets[i], offsets[i + 1]):
+                    space = is_space[buffer[j]]
+                    n += previous_space and not space
+                    previous_space = space
+                counts[i] = n
+        
+        _count_words_kernel = kernel
+    return _count_words_kernel
+
+
+def count_words_batch(texts: Sequence[str]):
+    """
+    Count the words in each of many texts at once
+    
+    Gives the same counts as calling count_words() on every text. With numba
+    installed, the texts are joined into one buffer and counted by a compiled
+    loop spread across all CPU cores, which is much faster than one Python
+    call per text on large corpora of short strings.
+    
+    Args:
+        texts: Sequence of text strings
+    
+    Returns:
+        numpy.ndarray or None: Word count per text, or None if NumPy is unavailable
+    
+    Example:
+        >>> count_words_batch(["Hello world", "one two three", ""])
+        array([2, 3, 0])
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        logger.error("NumPy not installed. Install with: pip install numpy")
+        return None
+    
+    try:
+        kernel = _get_count_words_kernel()
+    except ImportError:
+        return np.fromiter((len(text.split()) for text in texts), dtype=np.int64, count=len(texts))
+    
+    texts = list(texts)
+    joined = ''.join(texts)
+    non_ascii = []
+    if not joined.isascii():
+        # The kernel only knows ASCII whitespace; other texts are counted with split()
+        non_ascii = [i for i, text in enumerate(texts) if not text.isascii()]
+        skipped = set(non_ascii)
+        joined = ''.join(text for i, text in enumerate(texts) if i not in skipped)
+        lengths = (0 if i in skipped else len(text) for i, text in enumerate(texts))
+    else:
+        lengths = map(len, texts)
+    
+    offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(lengths, dtype=np.int64, count=len(texts)), out=offsets[1:])
+    is_space = np.zeros(256, dtype=np.bool_)
+    is_space[list(_ASCII_SPACE_BYTES)] = True
+    
+    counts = np.empty(len(texts), dtype=np.int64)
+    kernel(np.frombuffer(joined.encode('ascii'), dtype=np.uint8), offsets, is_space, counts)
+    for i in non_ascii:
+        counts[i] = len(texts[i].split())
+    return counts
+
+
 def reverse_text(text: str) -> str:
     """
     Reverse a text string
@@ -57,13 +201,36 @@ def reverse_text(text: str) -> str:
         >>> reverse_text("Hello")
         'olleH'
     """
+    # str already stores ASCII text one byte per character, so the slice is a
+    # plain byte reverse; an encode/[::-1]/decode round trip only adds copies
     return text[::-1]
 
 
+def _memoize_short(func):
+    """Memoize a one-argument text function for texts of up to _CASE_CACHE_MAX_LENGTH characters"""
+    cached = lru_cache(maxsize=_CASE_CACHE_SIZE)(func)
+    
+    @wraps(func)
+    def wrapper(text):
+        # Long texts are rarely repeated and would pin a lot of memory
+        if len(text) <= _CASE_CACHE_MAX_LENGTH:
+            return cached(text)
+        return func(text)
+    
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@_memoize_short
 def to_title_case(text: str) -> str:
     """
     Convert text to title case
     
+    Each whitespace-separated word gets its first character uppercased and
+    the rest lowercased, so apostrophes and hyphens do not start new words
+    (str.title() would give "Don'T").
+    
     Args:
         text: Input text string
     
@@ -73,10 +240,38 @@ def to_title_case(text: str) -> str:
     Example:
         >>> to_title_case("hello world")
         'Hello World'
+        >>> to_title_case("don't stop")
+        "Don't Stop"
     """
-    return text.title()
+    # With nothing but ASCII letters between the spaces, str.title() finds the
+    # same words in one C pass (non-ASCII "letters" such as U+02BC or CJK
+    # have no case, and title() would start a new word after them)
+    if text.isascii() and text.replace(' ', '').isalpha():
+        return text.title()
+    # The captured separators come back unchanged, since capitalize() leaves whitespace alone
+    return ''.join([part.capitalize() for part in _WHITESPACE_SPLIT_RE.split(text)])
+
+
+def _join_words(text: str, separator: str) -> str:
+    """Drop punctuation, lowercase, and turn each whitespace run into separator"""
+    if not text.isascii():
+        text = _NON_WORD_SPACE_RE.sub('', text)
+        return _WHITESPACE_RE.sub(separator, text).lower()
+    
+    # One C-level translate plus split/join instead of two regex passes and lower()
+    text = text.translate(_ASCII_SLUG_TABLE)
+    words = text.split()
+    if not words:
+        return separator if text else ''
+    joined = separator.join(words)
+    if text[0].isspace():
+        joined = separator + joined
+    if text[-1].isspace():
+        joined += separator
+    return joined
 
 
+@_memoize_short
 def to_snake_case(text: str) -> str:
     """
     Convert text to snake_case
@@ -91,12 +286,11 @@ def to_snake_case(text: str) -> str:
         >>> to_snake_case("Hello World Example")
         'hello_world_example'
     """
-    # Replace spaces and special characters with underscores
-    text = re.sub(r'[^\w\s]', '', text)
-    text = re.sub(r'\s+', '_', text)
-    return text.lower()
+    # Remove special characters and replace whitespace with underscores
+    return _join_words(text, '_')
 
 
+@_memoize_short
 def to_camel_case(text: str) -> str:
     """
     Convert text to camelCase
@@ -114,9 +308,14 @@ def to_camel_case(text: str) -> str:
     words = text.split()
     if not words:
         return text
-    return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
+    # Blank out the first word in place and map the C capitalize over the
+    # whole list, instead of slicing words[1:] and running a generator
+    first = words[0].lower()
+    words[0] = ''
+    return first + ''.join(map(str.capitalize, words))
 
 
+@_memoize_short
 def to_kebab_case(text: str) -> str:
     """
     Convert text to kebab-case
@@ -131,10 +330,130 @@ def to_kebab_case(text: str) -> str:
         >>> to_kebab_case("Hello World Example")
         'hello-world-example'
     """
-    # Replace spaces and special characters with hyphens
-    text = re.sub(r'[^\w\s]', '', text)
-    text = re.sub(r'\s+', '-', text)
-    return text.lower()
+    # Remove special characters and replace whitespace with hyphens
+    return _join_words(text, '-')
+
+
+def _case_batch(texts, convert_ascii, convert):
+    """Convert every text with pyarrow kernels, using convert() for non-ASCII rows"""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        logger.error("PyArrow not installed. Install with: pip install pyarrow")
+        return None
+    
+    if isinstance(texts, pa.ChunkedArray):
+        texts = texts.combine_chunks()
+    elif not isinstance(texts, pa.Array):
+        texts = pa.array(texts, type=pa.string())
+    
+    result = convert_ascii(pc, texts)
+    
+    # The kernels only match the str methods on ASCII; redo the rest in Python
+    non_ascii = pc.fill_null(pc.invert(pc.string_is_ascii(texts)), False)
+    if pc.any(non_ascii).as_py():
+        converted = [convert(text) for text in texts.filter(non_ascii).to_pylist()]
+        result = pc.replace_with_mask(result, non_ascii, pa.array(converted, type=result.type))
+    return result
+
+
+def _join_words_arrow(pc, texts, separator: str):
+    """_join_words for an array of ASCII strings"""
+    # Matching is cheaper than replacing, so skip the rewrite for columns
+    # without punctuation
+    punctuation = f'[^A-Za-z0-9_{_RE2_SPACE_CLASS}]'
+    if pc.any(pc.match_substring_regex(texts, pattern=punctuation)).as_py():
+        texts = pc.replace_substring_regex(texts, pattern=punctuation, replacement='')
+    # Regex replacement costs several times a literal one; most columns only
+    # ever have single spaces between words, which a literal replace handles
+    if pc.any(pc.match_substring_regex(texts, pattern=_RE2_NOT_SINGLE_SPACE)).as_py():
+        texts = pc.replace_substring_regex(texts, pattern=f'[{_RE2_SPACE_CLASS}]+', replacement=separator)
+    else:
+        texts = pc.replace_substring(texts, pattern=' ', replacement=separator)
+    return pc.ascii_lower(texts)
+
+
+def _camel_case_arrow(pc, texts):
+    """to_camel_case for an array of ASCII strings"""
+    trimmed = pc.ascii_trim(texts, characters=_ASCII_SPACE_CHARS)
+    # pyarrow's own (much faster) whitespace split misses \x1c-\x1f
+    if pc.any(pc.match_substring_regex(trimmed, pattern='[\\x1c-\\x1f]')).as_py():
+        words = pc.split_pattern_regex(trimmed, pattern=f'[{_RE2_SPACE_CLASS}]+')
+    else:
+        words = pc.ascii_split_whitespace(trimmed)
+    capitalized = type(words).from_arrays(words.offsets, pc.ascii_capitalize(words.values),
+                                          mask=words.is_null())
+    camel = pc.binary_join_element_wise(
+        pc.ascii_lower(pc.list_element(words, 0)),
+        pc.binary_join(pc.list_slice(capitalized, 1), ''),
+        '',
+    )
+    # Like to_camel_case, text with no words at all comes back unchanged
+    return pc.if_else(pc.equal(trimmed, ''), texts, camel)
+
+
+def to_snake_case_batch(texts):
+    """
+    Convert many texts to snake_case at once with pyarrow
+    
+    The conversion runs in pyarrow's C++ kernels over the whole column,
+    instead of one Python call per text. Results match to_snake_case();
+    null entries stay null.
+    
+    Args:
+        texts: pyarrow string array (or sequence of strings)
+    
+    Returns:
+        pyarrow.Array or None: Converted texts, or None if PyArrow is unavailable
+    
+    Example:
+        >>> to_snake_case_batch(["Hello World", "Foo Bar!"]).to_pylist()
+        ['hello_world', 'foo_bar']
+    """
+    return _case_batch(texts, lambda pc, array: _join_words_arrow(pc, array, '_'), to_snake_case)
+
+
+def to_camel_case_batch(texts):
+    """
+    Convert many texts to camelCase at once with pyarrow
+    
+    The conversion runs in pyarrow's C++ kernels over the whole column,
+    instead of one Python call per text. Results match to_camel_case();
+    null entries stay null.
+    
+    Args:
+        texts: pyarrow string array (or sequence of strings)
+    
+    Returns:
+        pyarrow.Array or None: Converted texts, or None if PyArrow is unavailable
+    
+    Example:
+        >>> to_camel_case_batch(["hello world", "foo bar baz"]).to_pylist()
+        ['helloWorld', 'fooBarBaz']
+    """
+    return _case_batch(texts, _camel_case_arrow, to_camel_case)
+
+
+def to_kebab_case_batch(texts):
+    """
+    Convert many texts to kebab-case at once with pyarrow
+    
+    The conversion runs in pyarrow's C++ kernels over the whole column,
+    instead of one Python call per text. Results match to_kebab_case();
+    null entries stay null.
+    
+    Args:
+        texts: pyarrow string array (or sequence of strings)
+    
+    Returns:
+        pyarrow.Array or None: Converted texts, or None if PyArrow is unavailable
+    
+    Example:
+        >>> to_kebab_case_batch(["Hello World", "Foo Bar!"]).to_pylist()
+        ['hello-world', 'foo-bar']
+    """
+    return _case_batch(texts, lambda pc, array: _join_words_arrow(pc, array, '-'), to_kebab_case)
 
 
 def remove_extra_spaces(text: str) -> str:
@@ -151,7 +470,62 @@ def remove_extra_spaces(text: str) -> str:
         >>> remove_extra_spaces("Hello    world   test")
         'Hello world test'
     """
-    return ' '.join(text.split())
+    if len(text) <= _SPLIT_CHUNK:
+        return ' '.join(text.split())
+    
+    # As in count_words(), split a slice at a time so the word list stays
+    # small; a word running across the slice boundary is glued back together
+    parts = []
+    in_word = False
+    for start in range(0, len(text), _SPLIT_CHUNK):
+        chunk = text[start:start + _SPLIT_CHUNK]
+        words = chunk.split()
+        if words:
+            joined = ' '.join(words)
+            if parts and not (in_word and not chunk[0].isspace()):
+                joined = ' ' + joined
+            parts.append(joined)
+        in_word = not chunk[-1].isspace()
+    return ''.join(parts)
+
+
+def iter_emails(text: str) -> Iterator[str]:
+    """
+    Lazily yield the email addresses in text
+    
+    Finds the same addresses as extract_emails, one at a time, so a caller
+    that stops early (e.g. ``next(iter_emails(text), None)``) does not scan
+    the rest of the text or build a list.
+    
+    Args:
+        text: Input text string
+    
+    Returns:
+        iterator: Email addresses, in the order they appear
+    
+    Example:
+        >>> next(iter_emails("Contact us at info@example.com or support@test.org"))
+        'info@example.com'
+    """
+    find = text.find
+    pos = 0  # end of the last address; the next one cannot start before it
+    lo = 0   # local parts never contain '@', so never reach back past the last one
+    at = find('@')
+    while at >= 0:
+        domain = _EMAIL_DOMAIN_RE.match(text, at + 1)
+        if domain is not None:
+            # The local part is the run of allowed characters right before '@'
+            # (measured on the reversed run) starting at its first word boundary
+            start = at - _EMAIL_LOCAL_RE.match(text[lo:at][::-1]).end()
+            boundary = _WORD_BOUNDARY_RE.search(text, start, at) if start < at else None
+            if boundary is not None and boundary.start() < at:
+                pos = domain.end()
+                yield text[boundary.start():pos]
+                lo = pos
+                at = find('@', pos)
+                continue
+        lo = max(pos, at + 1)
+        at = find('@', at + 1)
 
 
 def extract_emails(text: str) -> List[str]:
@@ -168,8 +542,29 @@ def extract_emails(text: str) -> List[str]:
         >>> extract_emails("Contact us at info@example.com or support@test.org")
         ['info@example.com', 'support@test.org']
     """
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    return re.findall(email_pattern, text)
+    if '@' not in text:
+        return []
+    return list(iter_emails(text))
+
+
+def iter_urls(text: str) -> Iterator[str]:
+    """
+    Lazily yield the URLs in text
+    
+    Finds the same URLs as extract_urls, one at a time, so a caller that
+    stops early does not scan the rest of the text or build a list.
+    
+    Args:
+        text: Input text string
+    
+    Returns:
+        iterator: URLs, in the order they appear
+    
+    Example:
+        >>> next(iter_urls("Visit https://example.com or http://test.org"))
+        'https://example.com'
+    """
+    return (match.group() for match in _URL_RE.finditer(text))
 
 
 def extract_urls(text: str) -> List[str]:
@@ -186,8 +581,46 @@ def extract_urls(text: str) -> List[str]:
         >>> extract_urls("Visit https://example.com or http://test.org")
         ['https://example.com', 'http://test.org']
     """
-    url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-    return re.findall(url_pattern, text)
+    if '://' not in text:
+        return []
+    return _URL_RE.findall(text)
+
+
+# extract_all() kinds
+_EXTRACTORS = {
+    'email': extract_emails,
+    'url': extract_urls,
+}
+
+
+def extract_all(text: str, kinds: Sequence[str] = ("email", "url")) -> Dict[str, List[str]]:
+    """
+    Extract several kinds of item from text in one call
+    
+    Each kind is found exactly as its extract_* function finds it, so an
+    email address inside a URL is reported under both. Kinds whose marker
+    ('@' for emails, '://' for URLs) is absent are skipped without scanning,
+    as in the extract_* functions.
+    
+    Args:
+        text: Input text string
+        kinds: Kinds to extract, any of "email" and "url" (default: both)
+    
+    Returns:
+        dict: Mapping of each requested kind to the list of matches found
+    
+    Example:
+        >>> extract_all("Mail info@example.com or visit https://example.com")
+        {'email': ['info@example.com'], 'url': ['https://example.com']}
+    """
+    found = {}
+    for kind in kinds:
+        try:
+            extract = _EXTRACTORS[kind]
+        except KeyError:
+            raise ValueError(f"Unknown kind {kind!r}; expected one of {sorted(_EXTRACTORS)}") from None
+        found[kind] = extract(text)
+    return found
 
 
 def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
@@ -211,6 +644,37 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     return text[:max_length - len(suffix)] + suffix
 
 
+def make_truncator(max_length: int, suffix: str = "...") -> Callable[[str], str]:
+    """
+    Precompute a truncate_text for a fixed max_length and suffix
+    
+    The cut position is worked out once up front, so each call is a length
+    check plus, only for long text, one slice. Truncates like truncate_text,
+    except that a suffix longer than max_length cuts the text to nothing
+    rather than slicing from the end.
+    
+    Args:
+        max_length: Maximum length of the output
+        suffix: Suffix to add when truncating (default: "...")
+    
+    Returns:
+        callable: Function taking a text and returning it truncated
+    
+    Example:
+        >>> truncate_title = make_truncator(10)
+        >>> truncate_title("This is a very long text")
+        'This is...'
+    """
+    end = max(max_length - len(suffix), 0)
+    
+    def truncate(text: str) -> str:
+        if len(text) <= max_length:
+            return text
+        return text[:end] + suffix
+    
+    return truncate
+
+
 def remove_html_tags(text: str) -> str:
     """
     Remove HTML tags from text
@@ -225,8 +689,14 @@ def remove_html_tags(text: str) -> str:
         >>> remove_html_tags("<p>Hello <b>world</b></p>")
         'Hello world'
     """
-    clean = re.compile('<.*?>')
-    return re.sub(clean, '', text)
+    # Plain text is common here and a substring check is far cheaper than a sub
+    if '<' not in text:
+        return text
+    stripped = _INNER_TAG_RE.sub('', text)
+    if '<' not in stripped:
+        return stripped
+    # Tags are matched with an empty group, text and unclosed '<' runs kept
+    return ''.join(_TAG_OR_TEXT_RE.findall(text))
 
 
 def count_occurrences(text: str, substring: str, case_sensitive: bool = True) -> int:
@@ -245,16 +715,70 @@ def count_occurrences(text: str, substring: str, case_sensitive: bool = True) ->
         >>> count_occurrences("Hello hello HELLO", "hello", case_sensitive=False)
         3
     """
-    if not case_sensitive:
+    # A substring without letters matches ASCII text the same either way, so
+    # skip lowercasing (copying) the whole text; isascii() is O(1) on str
+    if not case_sensitive and not (text.isascii() and substring.isascii()
+                                   and substring.lower() == substring.upper()):
         text = text.lower()
         substring = substring.lower()
     return text.count(substring)
 
 
+# replace_multiple() switches from one regex alternation to an Aho-Corasick
+# automaton at this many keys
+_AUTOMATON_MIN_KEYS = 50
+
+
+@lru_cache(maxsize=256)
+def _get_repl_pattern(keys: tuple):
+    """Compile the alternation replace_multiple uses for these (ordered) keys"""
+    return re.compile('|'.join(map(re.escape, keys)))
+
+
+@lru_cache(maxsize=256)
+def _get_repl_automaton(keys: frozenset):
+    """Build a pyahocorasick automaton over these keys, storing each key's length"""
+    import ahocorasick
+    
+    automaton = ahocorasick.Automaton()
+    for key in keys:
+        automaton.add_word(key, len(key))
+    automaton.make_automaton()
+    return automaton
+
+
+def _replace_with_automaton(text: str, replacements: Dict[str, str], automaton) -> str:
+    """Leftmost-longest, non-overlapping replacement driven by an Aho-Corasick scan"""
+    # iter() reports every (overlapping) match by its end; keep the longest
+    # key starting at each position, then take them left to right
+    longest = {}
+    for end, length in automaton.iter(text):
+        start = end - length + 1
+        if length > longest.get(start, 0):
+            longest[start] = length
+    if not longest:
+        return text
+    
+    parts = []
+    pos = 0
+    for start in sorted(longest):
+        if start < pos:
+            continue
+        parts.append(text[pos:start])
+        pos = start + longest[start]
+        parts.append(replacements[text[start:pos]])
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
 def replace_multiple(text: str, replacements: Dict[str, str]) -> str:
     """
     Replace multiple substrings in text
     
+    All replacements happen in a single pass: where keys overlap the longest
+    one wins, and replaced text is never rescanned, so the result does not
+    depend on the order of the dictionary.
+    
     Args:
         text: Input text string
         replacements: Dictionary of {old: new} replacements
@@ -265,7 +789,88 @@ def replace_multiple(text: str, replacements: Dict[str, str]) -> str:
     Example:
         >>> replace_multiple("Hello world", {"Hello": "Hi", "world": "there"})
         'Hi there'
+        >>> replace_multiple("a b", {"a": "b", "b": "a"})
+        'b a'
     """
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    return text
+    keys = [key for key in replacements if key]
+    if not keys:
+        return text
+    if len(keys) == 1:
+        return text.replace(keys[0], replacements[keys[0]])
+    if all(len(key) == 1 for key in keys):
+        return text.translate(str.maketrans({key: replacements[key] for key in keys}))
+    
+    # re tries every alternative at every position, so with many keys a
+    # single Aho-Corasick pass (when pyahocorasick is installed) wins
+    if len(keys) >= _AUTOMATON_MIN_KEYS:
+        try:
+            return _replace_with_automaton(text, replacements, _get_repl_automaton(frozenset(keys)))
+        except ImportError:
+            pass
+    
+    # Longest first, so the alternation prefers "abc" over "ab" at the same
+    # spot; ties sorted too so equal key sets share one cached pattern
+    pattern = _get_repl_pattern(tuple(sorted(keys, key=lambda key: (-len(key), key))))
+    return pattern.sub(lambda match: replacements[match.group(0)], text)
+
+
+class TextCleaner:
+    """
+    Reusable cleaning pipeline: strip HTML tags, collapse whitespace, and
+    optionally convert the case
+    
+    Each step gives the same result as the matching function
+    (remove_html_tags, remove_extra_spaces, to_*_case). The bound regex
+    methods and the case converter are looked up once in __init__, so
+    cleaning many texts skips the per-call function and global lookups of
+    chaining the functions by hand.
+    
+    Example:
+        >>> cleaner = TextCleaner(case='snake')
+        >>> cleaner.clean("<p>Hello   <b>World</b>!</p>")
+        'hello_world'
+    """
+    
+    __slots__ = ('_strip_html', '_collapse_spaces', '_convert_case',
+                 '_sub_inner_tags', '_findall_tags_or_text')
+    
+    def __init__(self, strip_html: bool = True, collapse_spaces: bool = True,
+                 case: Optional[str] = None):
+        """
+        Args:
+            strip_html: Whether to remove HTML tags (default: True)
+            collapse_spaces: Whether to collapse whitespace runs to single
+                             spaces and trim the ends (default: True)
+            case: Case to convert to last: 'snake', 'camel', 'kebab' or
+                  'title' (default: None, leave the case alone)
+        """
+        converters = {'snake': to_snake_case, 'camel': to_camel_case,
+                      'kebab': to_kebab_case, 'title': to_title_case}
+        if case is not None and case not in converters:
+            raise ValueError(f"Unknown case {case!r}; expected one of {sorted(converters)}")
+        
+        self._strip_html = strip_html
+        self._collapse_spaces = collapse_spaces
+        self._convert_case = converters.get(case)
+        self._sub_inner_tags = _INNER_TAG_RE.sub
+        self._findall_tags_or_text = _TAG_OR_TEXT_RE.findall
+    
+    def clean(self, text: str) -> str:
+        """
+        Run the configured steps on a text
+        
+        Args:
+            text: Input text string
+        
+        Returns:
+            str: Cleaned text
+        """
+        if self._strip_html and '<' in text:
+            # Same two-stage scan as remove_html_tags()
+            stripped = self._sub_inner_tags('', text)
+            text = stripped if '<' not in stripped else ''.join(self._findall_tags_or_text(text))
+        if self._collapse_spaces:
+            text = ' '.join(text.split()) if len(text) <= _SPLIT_CHUNK else remove_extra_spaces(text)
+        if self._convert_case is not None:
+            text = self._convert_case(text)
+        return text